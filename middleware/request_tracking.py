@@ -1,7 +1,9 @@
 """
 Request ID tracking middleware for distributed tracing.
 """
-import uuid
+import os
+import random
+import threading
 import contextvars
 from typing import Any
 from functools import wraps
@@ -11,6 +13,8 @@ import inspect
 
 # Context variable for request ID (thread-safe and async-safe)
 request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar('request_id', default='')
+# Bound once: RequestIDFilter reads the request ID on every log record
+_current_request_id = request_id_var.get
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +23,41 @@ class RequestIDFilter(logging.Filter):
     """Logging filter that adds request_id to all log records"""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        record.request_id = request_id_var.get() or 'no-request-id'  # type: ignore
+        record.request_id = _current_request_id() or 'no-request-id'  # type: ignore
         return True
 
 
+# Per-thread generators seeded from os.urandom; reset in forked children so
+# they never replay the parent's sequence
+_rng_local = threading.local()
+
+
+def _reset_rng_local() -> None:
+    global _rng_local
+    _rng_local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_rng_local)
+
+# Version (4) and RFC 4122 variant bits of a UUID held as a 128-bit int
+_UUID4_CLEAR_MASK = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID4_SET_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+
 def generate_request_id() -> str:
-    """Generate unique request ID"""
-    return str(uuid.uuid4())
+    """
+    Generate unique request ID.
+
+    Returns a UUID4-formatted string built from a per-thread generator,
+    which avoids uuid.uuid4()'s os.urandom call and UUID object per request.
+    """
+    try:
+        rng = _rng_local.rng
+    except AttributeError:
+        rng = _rng_local.rng = random.Random(os.urandom(32))
+    h = f"{rng.getrandbits(128) & _UUID4_CLEAR_MASK | _UUID4_SET_BITS:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def set_request_id(request_id: str | None = None) -> str:
@@ -51,7 +83,7 @@ def get_request_id() -> str:
     Returns:
         Current request ID, or empty string if not set
     """
-    return request_id_var.get()
+    return _current_request_id()
 
 
 def track_request(func):
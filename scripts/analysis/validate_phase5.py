@@ -15,7 +15,10 @@ Tests all 8 improvements from Phase 5:
 
 import sys
 import os
+import io
+import contextlib
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 # Add project root to path
@@ -251,32 +254,30 @@ def test_configuration() -> bool:
         os.environ["LLM_CONCURRENCY_LIMIT"] = "20"
         os.environ["ENVIRONMENT"] = "development"
 
-        # Need to reload config to pick up env vars
-        import importlib
-        if 'utils.config' in sys.modules:
-            importlib.reload(sys.modules['utils.config'])
+        # Build a fresh snapshot from the environment; reloading utils.config
+        # would re-run its imports and rebind the shared module-level config
+        from utils.config import Settings
+        config = Settings.from_env()
 
-        from utils.config import Config
-
-        print_pass("Successfully imported Config")
+        print_pass("Successfully imported config")
 
         # Test DB pool size
-        if Config.DB_POOL_SIZE == 15:
-            print_pass(f"DB_POOL_SIZE correctly loaded: {Config.DB_POOL_SIZE}")
+        if config.db_pool_size == 15:
+            print_pass(f"DB_POOL_SIZE correctly loaded: {config.db_pool_size}")
         else:
-            print_fail(f"DB_POOL_SIZE incorrect: {Config.DB_POOL_SIZE} (expected 15)")
+            print_fail(f"DB_POOL_SIZE incorrect: {config.db_pool_size} (expected 15)")
             return False
 
         # Test LLM concurrency
-        if Config.LLM_CONCURRENCY_LIMIT == 20:
-            print_pass(f"LLM_CONCURRENCY_LIMIT correctly loaded: {Config.LLM_CONCURRENCY_LIMIT}")
+        if config.llm_concurrency_limit == 20:
+            print_pass(f"LLM_CONCURRENCY_LIMIT correctly loaded: {config.llm_concurrency_limit}")
         else:
-            print_fail(f"LLM_CONCURRENCY_LIMIT incorrect: {Config.LLM_CONCURRENCY_LIMIT} (expected 20)")
+            print_fail(f"LLM_CONCURRENCY_LIMIT incorrect: {config.llm_concurrency_limit} (expected 20)")
             return False
 
         # Test environment detection
-        if Config.IS_DEVELOPMENT and not Config.IS_PRODUCTION:
-            print_pass(f"Environment correctly detected: {Config.ENVIRONMENT}")
+        if config.is_development and not config.is_production:
+            print_pass(f"Environment correctly detected: {config.environment}")
         else:
             print_fail("Environment detection failed")
             return False
@@ -403,6 +404,24 @@ def test_serialization() -> bool:
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
+CHECKS = {
+    "Entity Normalization": test_entity_normalization,
+    "Pydantic Models": test_pydantic_models,
+    "Request Tracking": test_request_tracking,
+    "Configuration": test_configuration,
+    "Error Sanitization": test_error_sanitization,
+    "Serialization": test_serialization,
+}
+
+
+def _run_check(name: str) -> tuple[bool, str]:
+    """Run one check in a worker process, capturing its output for ordered printing"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        passed = CHECKS[name]()
+    return passed, buffer.getvalue()
+
+
 def main():
     """Run all validation tests"""
     print_header("PHASE 5 IMPLEMENTATION VALIDATION")
@@ -414,13 +433,12 @@ def main():
 
     results = {}
 
-    # Run all tests
-    results["Entity Normalization"] = test_entity_normalization()
-    results["Pydantic Models"] = test_pydantic_models()
-    results["Request Tracking"] = test_request_tracking()
-    results["Configuration"] = test_configuration()
-    results["Error Sanitization"] = test_error_sanitization()
-    results["Serialization"] = test_serialization()
+    # Run all tests, one process each: the checks are independent, pay their
+    # heavy imports separately, and the env vars some of them set stay isolated
+    with ProcessPoolExecutor(max_workers=min(len(CHECKS), os.cpu_count() or 1)) as executor:
+        for name, (passed_test, output) in zip(CHECKS, executor.map(_run_check, CHECKS)):
+            print(output, end="")
+            results[name] = passed_test
 
     # Summary
     print_header("VALIDATION SUMMARY")
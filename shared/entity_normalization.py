@@ -4,6 +4,13 @@ Consolidates entity handling logic used across the application.
 """
 from typing import Any
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
 
 
 # Country aliases dictionary
@@ -202,10 +209,37 @@ ISO3_CODES: dict[str, str] = {
 }
 
 
+def _lowercase_aliases(aliases: dict[str, str]) -> dict[str, str]:
+    """Key an alias table by lowercased alias, keeping the first match."""
+    lowered: dict[str, str] = {}
+    for alias, canonical in aliases.items():
+        lowered.setdefault(alias.lower(), canonical)
+    return lowered
+
+
+# Case-insensitive lookup tables, built once at import
+_COUNTRY_ALIASES_LOWER = _lowercase_aliases(COUNTRY_ALIASES)
+_STATE_ALIASES_LOWER = _lowercase_aliases(STATE_ALIASES)
+_CITY_ALIASES_LOWER = _lowercase_aliases(CITY_ALIASES)
+
+# Merged per entity_type so a lookup is a single dict probe; later tables win
+# on collision, giving country > admin1 > city precedence. Types not listed
+# here (e.g. 'country') only consult the country aliases.
+_ALIAS_LOOKUP_BY_TYPE: dict[str | None, dict[str, str]] = {
+    None: {**_CITY_ALIASES_LOWER, **_STATE_ALIASES_LOWER, **_COUNTRY_ALIASES_LOWER},
+    "admin1": {**_STATE_ALIASES_LOWER, **_COUNTRY_ALIASES_LOWER},
+    "city": {**_CITY_ALIASES_LOWER, **_COUNTRY_ALIASES_LOWER},
+}
+_ALIAS_LOOKUP_BY_TYPE[""] = _ALIAS_LOOKUP_BY_TYPE[None]
+
+
+@lru_cache(maxsize=8192)
 def normalize_entity_name(entity_name: str, entity_type: str | None = None) -> str:
     """
     Normalize entity name using aliases and fuzzy matching.
 
+    Results are memoized, so entity_name must be hashable (a str).
+
     Args:
         entity_name: Raw entity name from user input
         entity_type: Optional type hint ('country', 'admin1', 'city')
@@ -217,34 +251,12 @@ def normalize_entity_name(entity_name: str, entity_type: str | None = None) -> s
         return entity_name
 
     normalized = entity_name.strip()
+    key = normalized.lower()
 
-    # Try exact match in country aliases (case-insensitive)
-    for alias, canonical in COUNTRY_ALIASES.items():
-        if normalized.lower() == alias.lower():
-            return canonical
-
-    # Try admin1 if level specified
-    if entity_type == "admin1":
-        for alias, canonical in STATE_ALIASES.items():
-            if normalized.lower() == alias.lower():
-                return canonical
-
-    # Try city if level specified
-    if entity_type == "city":
-        for alias, canonical in CITY_ALIASES.items():
-            if normalized.lower() == alias.lower():
-                return canonical
-
-    # If no level specified, try all
-    if not entity_type:
-        # Check admin1
-        for alias, canonical in STATE_ALIASES.items():
-            if normalized.lower() == alias.lower():
-                return canonical
-        # Check city
-        for alias, canonical in CITY_ALIASES.items():
-            if normalized.lower() == alias.lower():
-                return canonical
+    # Case-insensitive alias match across every level the entity_type allows
+    canonical = _ALIAS_LOOKUP_BY_TYPE.get(entity_type, _COUNTRY_ALIASES_LOWER).get(key)
+    if canonical is not None:
+        return canonical
 
     return normalized
 
@@ -270,6 +282,8 @@ def fuzzy_match_entity(
 
     name_lower = entity_name.lower()
     matches: list[tuple[str, float]] = []
+    fuzzy_candidates: list[str] = []
+    fuzzy_lower: list[str] = []
 
     for candidate in candidates:
         candidate_lower = candidate.lower()
@@ -284,10 +298,33 @@ def fuzzy_match_entity(
             matches.append((candidate, 0.9))
             continue
 
-        # Fuzzy similarity
-        similarity = SequenceMatcher(None, name_lower, candidate_lower).ratio()
-        if similarity >= threshold:
-            matches.append((candidate, similarity))
+        fuzzy_candidates.append(candidate)
+        fuzzy_lower.append(candidate_lower)
+
+    # Fuzzy similarity
+    if HAS_RAPIDFUZZ:
+        # One C++ batch call over all remaining candidates
+        scored = process.extract(
+            name_lower, fuzzy_lower, scorer=fuzz.ratio,
+            score_cutoff=threshold * 100, limit=None
+        )
+        for _, score, idx in sorted(scored, key=lambda x: x[2]):
+            matches.append((fuzzy_candidates[idx], score / 100))
+    else:
+        matcher = SequenceMatcher(None, name_lower)
+        name_len = len(name_lower)
+        for candidate, candidate_lower in zip(fuzzy_candidates, fuzzy_lower):
+            # ratio() can never exceed 2*min(len)/total len, so candidates whose
+            # length alone rules them out are rejected before any matching
+            candidate_len = len(candidate_lower)
+            if 2 * min(name_len, candidate_len) < threshold * (name_len + candidate_len):
+                continue
+            matcher.set_seq2(candidate_lower)
+            if matcher.quick_ratio() < threshold:
+                continue
+            similarity = matcher.ratio()
+            if similarity >= threshold:
+                matches.append((candidate, similarity))
 
     # Sort by similarity score (descending)
     matches.sort(key=lambda x: x[1], reverse=True)
@@ -13,11 +13,13 @@ import time
 import hashlib
 import uuid
 from pathlib import Path
-from typing import Any, Optional, Dict, List, Tuple, Set
+from typing import Any, Callable, Optional, Dict, List, Tuple, Set
 from datetime import datetime, timedelta
+import jsonschema
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
+    CallToolResult,
     Tool,
     TextContent,
     Resource,
@@ -32,6 +34,12 @@ import threading
 from queue import Queue, Empty, Full
 from contextlib import contextmanager
 
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
 # ---------------------------------------------------------------------
 # Logging Infrastructure (from mcp_server.py)
 # ---------------------------------------------------------------------
@@ -131,6 +139,13 @@ _PROJECT_ROOT = Path(__file__).parent.parent
 
 # Valid characters for identifiers (file_id, column names)
 _IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z0-9_\-\.]+$')
+# Characters rejected in string filter values
+_UNSAFE_FILTER_CHARS = re.compile(r'[;\'"\\]')
+# DuckDB binder error parsing. All are linear-time: no nested quantifiers,
+# so long or adversarial error text cannot trigger catastrophic backtracking
+_MISSING_COLUMN_PATTERN = re.compile(r'Referenced column\s+"([^"]+)"', re.IGNORECASE)
+_CANDIDATE_BINDINGS_PATTERN = re.compile(r'Candidate bindings:\s*"[^"]+"')
+_QUOTED_NAME_PATTERN = re.compile(r'"([^"]+)"')
 _MAX_QUERY_COMPLEXITY = {
     "max_columns": 50,
     "max_filters": 20,
@@ -347,7 +362,7 @@ def _validate_filter_value(value: Any, filter_type: str) -> Tuple[bool, Optional
         if len(value) > _MAX_QUERY_COMPLEXITY["max_string_length"]:
             return False, f"Filter value too long (max {_MAX_QUERY_COMPLEXITY['max_string_length']} chars)"
         # Check for potential injection patterns
-        if re.search(r'[;\'"\\]', value):
+        if _UNSAFE_FILTER_CHARS.search(value):
             return False, "Filter value contains potentially dangerous characters"
 
     return True, None
@@ -371,20 +386,17 @@ def _parse_duckdb_column_error(error_str: str) -> Optional[Tuple[List[str], List
 
     # Extract column names from error message
     # Find quoted column names (the ones that don't exist)
-    missing_pattern = r'Referenced column\s+"([^"]+)"'
-    missing_match = re.search(missing_pattern, error_str, re.IGNORECASE)
+    missing_match = _MISSING_COLUMN_PATTERN.search(error_str)
     if not missing_match:
         return None
 
     bad_columns = [missing_match.group(1)]
 
     # Extract candidate bindings
-    candidate_pattern = r'Candidate bindings:\s*"([^"]+)"(?:\s*,\s*"([^"]+)")*'
-    candidate_match = re.search(candidate_pattern, error_str)
     candidate_columns = []
-    if candidate_match:
+    if _CANDIDATE_BINDINGS_PATTERN.search(error_str):
         # Get all quoted values after "Candidate bindings:"
-        all_matches = re.findall(r'"([^"]+)"', error_str[error_str.find("Candidate bindings:"):])
+        all_matches = _QUOTED_NAME_PATTERN.findall(error_str[error_str.find("Candidate bindings:"):])
         candidate_columns = all_matches if all_matches else []
 
     return bad_columns, candidate_columns
@@ -1104,129 +1116,139 @@ def _coverage_index() -> Dict[str, List[str]]:
     return {k: sorted(v) for k, v in idx.items()}
 
 
+# Comprehensive country name mappings
+_COUNTRY_ALIASES = {
+    # United States variations
+    "USA": "United States of America",
+    "US": "United States of America",
+    "U.S.": "United States of America",
+    "U.S.A.": "United States of America",
+    "United States": "United States of America",
+    "America": "United States of America",
+
+    # United Kingdom variations
+    "UK": "United Kingdom",
+    "U.K.": "United Kingdom",
+    "Britain": "United Kingdom",
+    "Great Britain": "United Kingdom",
+    "England": "United Kingdom",  # Note: England is part of UK
+
+    # China variations
+    "China": "People's Republic of China",
+    "PRC": "People's Republic of China",
+    "Mainland China": "People's Republic of China",
+
+    # Russia variations
+    "Russia": "Russian Federation",
+
+    # Korea variations
+    "South Korea": "Republic of Korea",
+    "North Korea": "Democratic People's Republic of Korea",
+    "DPRK": "Democratic People's Republic of Korea",
+    "ROK": "Republic of Korea",
+
+    # Other common variations
+    "Holland": "Netherlands",
+    "Myanmar": "Burma",
+    "Czech Republic": "Czechia",
+    "Ivory Coast": "Côte d'Ivoire",
+    "UAE": "United Arab Emirates",
+    "Vietnam": "Viet Nam",
+    
+    # Database-specific abbreviations (from EDGAR data)
+    "bosnia and herz.": "Bosnia and Herzegovina",
+    "bosnia and herz": "Bosnia and Herzegovina",
+    "dem. rep. congo": "Democratic Republic of the Congo",
+    "eq. guinea": "Equatorial Guinea",
+    "n. mariana islands": "Northern Mariana Islands",
+    "st. kitts and nevis": "Saint Kitts and Nevis",
+    "st. lucia": "Saint Lucia",
+    "st. vincent and the grenadines": "Saint Vincent and the Grenadines",
+    "são tomé and príncipe": "Sao Tome and Principe",
+    "trinidad and tobago": "Trinidad and Tobago",
+    "u.s. virgin islands": "United States Virgin Islands",
+    "united rep. of tanzania": "United Republic of Tanzania",
+    
+    # Additional common variations
+    "czech rep.": "Czechia",
+    "central african rep.": "Central African Republic",
+    "dom. rep.": "Dominican Republic",
+}
+
+# Admin1 (state/province) mappings
+_ADMIN1_ALIASES = {
+    "Calif": "California",
+    "Cali": "California",
+    "CA": "California",
+    "NY": "New York",
+    "TX": "Texas",
+    "FL": "Florida",
+    "Mass": "Massachusetts",
+    "MA": "Massachusetts",
+    "Penn": "Pennsylvania",
+    "PA": "Pennsylvania",
+}
+
+# City mappings
+_CITY_ALIASES = {
+    "NYC": "New York City",
+    "LA": "Los Angeles",
+    "SF": "San Francisco",
+    "DC": "Washington",
+    "Philly": "Philadelphia",
+}
+
+
+def _lowercase_aliases(aliases: Dict[str, str]) -> Dict[str, str]:
+    """Key an alias table by lowercased alias, keeping the first match."""
+    lowered: Dict[str, str] = {}
+    for alias, canonical in aliases.items():
+        lowered.setdefault(alias.lower(), canonical)
+    return lowered
+
+
+# Case-insensitive lookup tables, built once at import
+_COUNTRY_ALIASES_LOWER = _lowercase_aliases(_COUNTRY_ALIASES)
+_ADMIN1_ALIASES_LOWER = _lowercase_aliases(_ADMIN1_ALIASES)
+_CITY_ALIASES_LOWER = _lowercase_aliases(_CITY_ALIASES)
+
+
+@lru_cache(maxsize=4096)
 def _normalize_entity_name(name: str, level: Optional[str] = None) -> str:
     """
     Normalize entity names to match database values.
     Handles common aliases, abbreviations, and variations.
+
+    Results are memoized; entity names repeat heavily across tool calls.
     """
     if not name:
         return name
 
     normalized = name.strip()
 
-    # Comprehensive country name mappings
-    country_aliases = {
-        # United States variations
-        "USA": "United States of America",
-        "US": "United States of America",
-        "U.S.": "United States of America",
-        "U.S.A.": "United States of America",
-        "United States": "United States of America",
-        "America": "United States of America",
-
-        # United Kingdom variations
-        "UK": "United Kingdom",
-        "U.K.": "United Kingdom",
-        "Britain": "United Kingdom",
-        "Great Britain": "United Kingdom",
-        "England": "United Kingdom",  # Note: England is part of UK
-
-        # China variations
-        "China": "People's Republic of China",
-        "PRC": "People's Republic of China",
-        "Mainland China": "People's Republic of China",
-
-        # Russia variations
-        "Russia": "Russian Federation",
-
-        # Korea variations
-        "South Korea": "Republic of Korea",
-        "North Korea": "Democratic People's Republic of Korea",
-        "DPRK": "Democratic People's Republic of Korea",
-        "ROK": "Republic of Korea",
-
-        # Other common variations
-        "Holland": "Netherlands",
-        "Myanmar": "Burma",
-        "Czech Republic": "Czechia",
-        "Ivory Coast": "Côte d'Ivoire",
-        "UAE": "United Arab Emirates",
-        "Vietnam": "Viet Nam",
-        
-        # Database-specific abbreviations (from EDGAR data)
-        "bosnia and herz.": "Bosnia and Herzegovina",
-        "bosnia and herz": "Bosnia and Herzegovina",
-        "dem. rep. congo": "Democratic Republic of the Congo",
-        "eq. guinea": "Equatorial Guinea",
-        "n. mariana islands": "Northern Mariana Islands",
-        "st. kitts and nevis": "Saint Kitts and Nevis",
-        "st. lucia": "Saint Lucia",
-        "st. vincent and the grenadines": "Saint Vincent and the Grenadines",
-        "são tomé and príncipe": "Sao Tome and Principe",
-        "trinidad and tobago": "Trinidad and Tobago",
-        "u.s. virgin islands": "United States Virgin Islands",
-        "united rep. of tanzania": "United Republic of Tanzania",
-        
-        # Additional common variations
-        "czech rep.": "Czechia",
-        "central african rep.": "Central African Republic",
-        "dom. rep.": "Dominican Republic",
-    }
-
-    # Admin1 (state/province) mappings
-    admin1_aliases = {
-        "Calif": "California",
-        "Cali": "California",
-        "CA": "California",
-        "NY": "New York",
-        "TX": "Texas",
-        "FL": "Florida",
-        "Mass": "Massachusetts",
-        "MA": "Massachusetts",
-        "Penn": "Pennsylvania",
-        "PA": "Pennsylvania",
-    }
-
-    # City mappings
-    city_aliases = {
-        "NYC": "New York City",
-        "LA": "Los Angeles",
-        "SF": "San Francisco",
-        "DC": "Washington",
-        "Philly": "Philadelphia",
-    }
+    key = normalized.lower()
 
     # Try exact match first (case-insensitive)
-    for alias, canonical in country_aliases.items():
-        if normalized.lower() == alias.lower():
+    canonical = _COUNTRY_ALIASES_LOWER.get(key)
+    if canonical is not None:
+        return canonical
+
+    # Try admin1 if level specified; if no level specified, try all
+    if level == "admin1" or not level:
+        canonical = _ADMIN1_ALIASES_LOWER.get(key)
+        if canonical is not None:
             return canonical
 
-    # Try admin1 if level specified
-    if level == "admin1":
-        for alias, canonical in admin1_aliases.items():
-            if normalized.lower() == alias.lower():
-                return canonical
-
     # Try city if level specified
-    if level == "city":
-        for alias, canonical in city_aliases.items():
-            if normalized.lower() == alias.lower():
-                return canonical
-
-    # If no level specified, try all
-    if not level:
-        # Check admin1
-        for alias, canonical in admin1_aliases.items():
-            if normalized.lower() == alias.lower():
-                return canonical
-        # Check city
-        for alias, canonical in city_aliases.items():
-            if normalized.lower() == alias.lower():
-                return canonical
+    if level == "city" or not level:
+        canonical = _CITY_ALIASES_LOWER.get(key)
+        if canonical is not None:
+            return canonical
 
     return normalized
 
 
+@lru_cache(maxsize=4096)
 def _get_iso3_code(country_name: str) -> str | None:
     """
     Get ISO3 country code for faster database queries.
@@ -1362,7 +1384,11 @@ def _fuzzy_match_entity(name: str, candidates: List[str], threshold: float = 0.8
         return []
 
     name_lower = name.lower()
+    name_len = len(name_lower)
     matches = []
+    # One matcher reused across candidates instead of a new one (and its
+    # lookup tables) per comparison
+    matcher = SequenceMatcher(None, name_lower)
 
     for candidate in candidates:
         candidate_lower = candidate.lower()
@@ -1377,8 +1403,15 @@ def _fuzzy_match_entity(name: str, candidates: List[str], threshold: float = 0.8
             matches.append((candidate, 0.9))
             continue
 
-        # Fuzzy similarity
-        similarity = SequenceMatcher(None, name_lower, candidate_lower).ratio()
+        # Fuzzy similarity; ratio() is bounded by 2*min(len)/total len and by
+        # quick_ratio(), so most candidates are rejected without full matching
+        candidate_len = len(candidate_lower)
+        if 2 * min(name_len, candidate_len) < threshold * (name_len + candidate_len):
+            continue
+        matcher.set_seq2(candidate_lower)
+        if matcher.quick_ratio() < threshold:
+            continue
+        similarity = matcher.ratio()
         if similarity >= threshold:
             matches.append((candidate, similarity))
 
@@ -1974,9 +2007,9 @@ def _get_data_type_distribution(rows: List[Dict[str, Any]]) -> Dict[str, float]:
 # TOOLS - Functions LLM can call
 # ========================================
 
-@app.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List all available tools"""
+@lru_cache(maxsize=1)
+def _tool_definitions() -> List[Tool]:
+    """Build the static tool definitions once"""
     return [
         Tool(
             name="list_emissions_datasets",
@@ -2588,9 +2621,54 @@ async def handle_list_tools() -> list[Tool]:
     ]
 
 
-@app.call_tool()
-async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
+@app.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List all available tools"""
+    return list(_tool_definitions())
+
+
+def _compile_input_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """Compile a tool input schema into a reusable check returning the first error message."""
+    if HAS_FASTJSONSCHEMA:
+        compiled = fastjsonschema.compile(schema)
+
+        def validate(arguments: Dict[str, Any]) -> Optional[str]:
+            try:
+                compiled(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                return e.message
+            return None
+    else:
+        validator = jsonschema.validators.validator_for(schema)(schema)
+
+        def validate(arguments: Dict[str, Any]) -> Optional[str]:
+            error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+            return error.message if error is not None else None
+
+    return validate
+
+
+@lru_cache(maxsize=1)
+def _input_validators() -> Dict[str, Callable[[Dict[str, Any]], Optional[str]]]:
+    """Compiled input validators keyed by tool name.
+
+    The SDK's built-in check calls jsonschema.validate, which rebuilds the
+    validator for every tool call; these are compiled once and reused.
+    """
+    return {tool.name: _compile_input_validator(tool.inputSchema) for tool in _tool_definitions()}
+
+
+@app.call_tool(validate_input=False)
+async def handle_call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolResult:
     """Handle tool calls"""
+    validate = _input_validators().get(name)
+    validation_error = validate(arguments or {}) if validate is not None else None
+    if validation_error is not None:
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"Input validation error: {validation_error}")],
+            isError=True
+        )
+
     logger.info(f"Tool called: {name}")
     logger.debug(f"Arguments: {json.dumps(arguments, default=str)[:200]}")
 
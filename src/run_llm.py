@@ -988,7 +988,7 @@ def get_persona_tone(persona: str) -> str:
     }
     return tone_map.get(persona, "informative")
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="CarbonLens - Climate data Q&A with baseline knowledge enrichment")
     parser.add_argument("question", help="Your question about climate/emissions data")
@@ -999,7 +999,7 @@ def main() -> None:
     parser.add_argument("--verbose", action="store_true", help="Show classification and intermediate results")
 
     try:
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
     except SystemExit:
         print('Usage: python run_llm.py "<your question>" [--persona PERSONA] [--no-baseline] [--verbose]')
         print('Example: python run_llm.py "How did Germany power emissions change 2022-2023?" --persona "Climate Analyst"')
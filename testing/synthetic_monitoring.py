@@ -15,6 +15,8 @@ Features:
 - Alert generation
 """
 
+import heapq
+import itertools
 import logging
 import json
 import requests
@@ -26,6 +28,22 @@ import time
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SCHEDULE_INTERVAL_S = 300
+
+
+def schedule_interval_seconds(schedule: str) -> int:
+    """Convert a cron schedule's minute field into a run interval in seconds.
+
+    Only the minute field is honoured ("*" or "*/N"); other schedules fall back
+    to the default five-minute interval.
+    """
+    minute_field = schedule.split()[0] if schedule.strip() else ""
+    if minute_field == "*":
+        return 60
+    if minute_field.startswith("*/") and minute_field[2:].isdigit() and int(minute_field[2:]) > 0:
+        return int(minute_field[2:]) * 60
+    return DEFAULT_SCHEDULE_INTERVAL_S
+
 
 @dataclass
 class SyntheticTransaction:
@@ -59,6 +77,9 @@ class SyntheticMonitor:
         self.production_url = production_url
         self.transactions: List[SyntheticTransaction] = []
         self.results: List[TransactionResult] = []
+        # Min-heap of (next_due_ts, seq, transaction) used by tick()
+        self._queue: List[tuple] = []
+        self._seq = itertools.count()
         self.sli_targets = {
             'availability': 0.99,  # 99% uptime
             'latency_p95': 2000,   # 95th percentile <= 2s
@@ -68,6 +89,7 @@ class SyntheticMonitor:
     def register_transaction(self, transaction: SyntheticTransaction) -> None:
         """Register a synthetic transaction."""
         self.transactions.append(transaction)
+        heapq.heappush(self._queue, (time.time(), next(self._seq), transaction))
         logger.info(f"Registered transaction: {transaction.name}")
 
     def create_health_check_transaction(self) -> SyntheticTransaction:
@@ -141,7 +163,9 @@ class SyntheticMonitor:
             timestamp=datetime.now().isoformat(),
             sla_met=sla_met,
             error=error,
-            step_results=step_results
+            # Step detail is only useful for diagnosing failures; dropping it on
+            # success keeps monitoring reports small
+            step_results=step_results if status != 'success' else None
         )
 
         self.results.append(result)
@@ -192,23 +216,51 @@ class SyntheticMonitor:
         logger.info(f"Running {len(self.transactions)} synthetic transactions...")
 
         results = []
+        run = self.run_transaction
+        append = results.append
         for transaction in self.transactions:
-            result = self.run_transaction(transaction)
-            results.append(result)
+            append(run(transaction))
 
         return self._calculate_metrics(results)
 
+    def tick(self, now: Optional[float] = None) -> List[TransactionResult]:
+        """Run only the transactions whose schedule is due, then reschedule them.
+
+        Newly registered transactions are due immediately; afterwards each one
+        runs again every interval derived from its cron ``schedule``.
+        """
+        now = time.time() if now is None else now
+        results = []
+
+        while self._queue and self._queue[0][0] <= now:
+            _, _, transaction = heapq.heappop(self._queue)
+            results.append(self.run_transaction(transaction))
+            next_due = now + schedule_interval_seconds(transaction.schedule)
+            heapq.heappush(self._queue, (next_due, next(self._seq), transaction))
+
+        return results
+
     def _calculate_metrics(self, results: List[TransactionResult]) -> Dict[str, Any]:
         """Calculate SLI/SLO metrics."""
         if not results:
             return {'total': 0}
 
-        successful = sum(1 for r in results if r.status == 'success')
-        sla_met = sum(1 for r in results if r.sla_met)
-        total_duration = sum(r.duration_ms for r in results)
+        # Single pass over results instead of one generator per aggregate
+        sla_met = 0
+        total_duration = 0.0
+        latencies = []
+        add_latency = latencies.append
+        for r in results:
+            duration_ms = r.duration_ms
+            total_duration += duration_ms
+            if r.sla_met:
+                sla_met += 1
+            if r.status == 'success':
+                add_latency(duration_ms)
+        successful = len(latencies)
+        latencies.sort()
 
         availability = successful / len(results) if results else 0
-        latencies = sorted([r.duration_ms for r in results if r.status == 'success'])
         p95_latency = latencies[int(len(latencies) * 0.95)] if latencies else 0
         error_rate = 1 - (successful / len(results)) if results else 0
 
@@ -11,6 +11,7 @@ Tests the HTTP bridge:
 """
 
 import asyncio
+import importlib.util
 import json
 import logging
 import os
@@ -21,9 +22,17 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+import httpx
+import numpy as np
 import requests
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -32,6 +41,9 @@ logger = logging.getLogger(__name__)
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# HTTP/2 multiplexing needs the optional h2 package; keep-alive works either way
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 @dataclass
 class BridgeTestResult:
@@ -51,6 +63,7 @@ class BridgeTester:
         self.bridge_process: Optional[subprocess.Popen] = None
         self.bridge_url: Optional[str] = None
         self.bridge_port: str = "8010"
+        self.client: Optional[httpx.AsyncClient] = None
 
     def log_result(self, test_name: str, status: str, duration: float,
                    message: str = "", error: str = ""):
@@ -71,6 +84,13 @@ class BridgeTester:
         if error:
             logger.error(f"   ✗ {error}")
 
+    async def _get(self, path: str, timeout: float = 5) -> httpx.Response:
+        """GET a bridge path through the shared client (one-off client if unset)"""
+        if self.client is not None:
+            return await self.client.get(path, timeout=timeout)
+        async with httpx.AsyncClient(base_url=self.bridge_url) as client:
+            return await client.get(path, timeout=timeout)
+
     async def test_bridge_startup(self) -> bool:
         """Test bridge startup"""
         logger.info("\n" + "="*80)
@@ -142,7 +162,7 @@ class BridgeTester:
                               message="Bridge not running")
                 return True
 
-            response = requests.get(f"{self.bridge_url}/health", timeout=5)
+            response = await self._get("/health")
 
             if response.status_code == 200:
                 duration = time.time() - start
@@ -171,10 +191,11 @@ class BridgeTester:
                               message="Bridge not running")
                 return True
 
-            response = requests.get(f"{self.bridge_url}/list_files", timeout=5)
+            response = await self._get("/list_files")
 
             if response.status_code == 200:
-                data = response.json()
+                # orjson parses the raw body directly; /list_files payloads can be large
+                data = orjson.loads(response.content) if HAS_ORJSON else response.json()
                 if isinstance(data, dict):
                     duration = time.time() - start
                     file_count = len(data.get("files", []))
@@ -209,19 +230,21 @@ class BridgeTester:
                 return True
 
             # Make rapid requests
-            success_count = 0
-            rate_limited = False
+            status_codes = []
 
             for i in range(5):
                 try:
-                    response = requests.get(f"{self.bridge_url}/health", timeout=5)
-                    if response.status_code == 429:  # Too Many Requests
-                        rate_limited = True
-                    else:
-                        success_count += 1
-                except requests.exceptions.RequestException:
+                    response = await self._get("/health")
+                    status_codes.append(response.status_code)
+                except httpx.HTTPError:
                     pass
 
+            # Histogram status codes in one pass; 429 is Too Many Requests
+            hist = np.bincount(np.asarray(status_codes, dtype=np.int32), minlength=600)
+            rate_limited_count = int(hist[429])
+            success_count = len(status_codes) - rate_limited_count
+            rate_limited = rate_limited_count > 0
+
             duration = time.time() - start
 
             if success_count > 0:
@@ -249,7 +272,7 @@ class BridgeTester:
                               message="Bridge not running")
                 return True
 
-            response = requests.get(f"{self.bridge_url}/health", timeout=5)
+            response = await self._get("/health")
 
             cors_headers = {
                 'access-control-allow-credentials',
@@ -287,7 +310,7 @@ class BridgeTester:
                 return True
 
             # Try invalid endpoint
-            response = requests.get(f"{self.bridge_url}/invalid_endpoint", timeout=5)
+            response = await self._get("/invalid_endpoint")
 
             if response.status_code == 404:
                 duration = time.time() - start
@@ -335,11 +358,22 @@ class BridgeTester:
         try:
             await self.test_bridge_startup()
             if self.bridge_process or self.bridge_url:
-                await self.test_health_endpoint()
-                await self.test_list_files_endpoint()
-                await self.test_rate_limiting()
-                await self.test_cors_headers()
-                await self.test_error_handling()
+                # Reuse one pooled connection for every endpoint test
+                async with httpx.AsyncClient(
+                    base_url=self.bridge_url or "",
+                    http2=HAS_HTTP2,
+                    timeout=10,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+                ) as client:
+                    self.client = client
+                    try:
+                        await self.test_health_endpoint()
+                        await self.test_list_files_endpoint()
+                        await self.test_rate_limiting()
+                        await self.test_cors_headers()
+                        await self.test_error_handling()
+                    finally:
+                        self.client = None
             await self.test_bridge_shutdown()
             return True
         except Exception as e:
@@ -15,14 +15,163 @@ Features:
 - Data variation generation
 """
 
+import functools
 import logging
-from typing import List, Dict, Any, Callable, Optional
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Optional, Union
 from datetime import datetime, timedelta
 import random
 import string
 
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+LOCATIONS = ["USA", "China", "India", "EU", "Japan"]
+LEVELS = ['country', 'state', 'city']
+GRAINS = ['year', 'month']
+MIN_YEAR, MAX_YEAR = 2015, 2023
+
+REQUIRED_QUESTION_FIELDS = ('id', 'question', 'category', 'sector', 'level', 'grain', 'difficulty')
+VALID_CATEGORIES = frozenset({'simple', 'temporal', 'comparative', 'complex'})
+VALID_DIFFICULTIES = frozenset({'easy', 'medium', 'hard'})
+MIN_QUESTION_LENGTH, MAX_QUESTION_LENGTH = 5, 500
+_DIGIT_RE = re.compile(r'\d')
+
+# Question templates specialized to f-strings once, so generation does not
+# re-parse a format string per question. All share one positional signature.
+# An f-string already compiles to a single BUILD_STRING over its literal
+# segments; assembling pre-split segments with str.join measured slower.
+_TEMPLATE_FNS = (
+    lambda sector, year, location, location2:
+        f"What are the total {sector} emissions for {year}?",
+    lambda sector, year, location, location2:
+        f"How much {sector} emissions did {location} produce in {year}?",
+    lambda sector, year, location, location2:
+        f"Compare {sector} emissions between {location} and {location2}",
+    lambda sector, year, location, location2:
+        f"What is the trend in {sector} emissions from {year - 5} to {year}?",
+)
+
+# Edge cases and boundary values are static, so they are built once (including
+# the 10k-char string); callers get fresh dict copies of the read-only originals
+_EDGE_CASES = tuple(MappingProxyType(case) for case in (
+    {
+        'id': 1,
+        'question': '',  # Empty question
+        'category': 'edge',
+        'expected_behavior': 'should return error'
+    },
+    {
+        'id': 2,
+        'question': 'x' * 10000,  # Very long question
+        'category': 'edge',
+        'expected_behavior': 'should handle or truncate'
+    },
+    {
+        'id': 3,
+        'question': '!!!###$$$%%%',  # Special characters
+        'category': 'edge',
+        'expected_behavior': 'should handle gracefully'
+    },
+    {
+        'id': 4,
+        'question': 'What are emissions in year 9999?',  # Future year
+        'category': 'edge',
+        'expected_behavior': 'should indicate no data available'
+    },
+    {
+        'id': 5,
+        'question': 'What are emissions in year 1900?',  # Historical
+        'category': 'edge',
+        'expected_behavior': 'should indicate no data available'
+    },
+    {
+        'id': 6,
+        'question': 'µ ñ ü ß 中文',  # Non-ASCII characters
+        'category': 'edge',
+        'expected_behavior': 'should handle unicode'
+    },
+))
+
+_BOUNDARY_VALUES = tuple(MappingProxyType(boundary) for boundary in (
+    {'value': 0, 'description': 'zero emissions'},
+    {'value': 1, 'description': 'single unit'},
+    {'value': 999999999, 'description': 'very large number'},
+    {'value': -1, 'description': 'negative number'},
+    {'value': 0.0001, 'description': 'very small decimal'},
+    {'value': None, 'description': 'null value'},
+))
+
+# Below this many questions, process start-up outweighs parallel validation
+PARALLEL_MIN_QUESTIONS = 10000
+
+# Below this many questions the JIT compile cost outweighs the kernel speedup
+JIT_MIN_COUNT = 1000
+
+
+def _draw_indices_numpy(count: int, bounds: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Draw a (count, len(bounds)) matrix of indices, column j in [0, bounds[j])."""
+    return rng.integers(0, bounds, size=(count, bounds.shape[0]))
+
+
+if HAS_NUMBA:
+    @njit(cache=True, inline='always')
+    def _splitmix64(x):
+        """SplitMix64 finalizer: a stateless, well-mixed 64-bit hash of x."""
+        z = x + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+    @njit(cache=True, parallel=True)
+    def _draw_indices_jit(count, bounds, seed):
+        """Parallel Numba kernel filling the index matrix.
+
+        Each cell is derived from (seed, cell position) with a counter-based
+        generator, so threads share no RNG state and the output is identical
+        for a given seed regardless of thread count.
+        """
+        k = bounds.shape[0]
+        out = np.empty((count, k), dtype=np.int64)
+        for i in prange(count):
+            for j in range(k):
+                r = _splitmix64(seed + np.uint64(i * k + j))
+                out[i, j] = np.int64(r % np.uint64(bounds[j]))
+        return out
+
+
+def _draw_indices(count: int, bounds: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Draw question choice indices, using the JIT kernel for large batches."""
+    if HAS_NUMBA and count >= JIT_MIN_COUNT:
+        seed = np.uint64(rng.integers(0, 2**63))
+        return _draw_indices_jit(count, bounds, seed)
+    return _draw_indices_numpy(count, bounds, rng)
+
+
+@dataclass(slots=True, frozen=True)
+class Question:
+    """Immutable test question; mutations share every unchanged field."""
+    id: int
+    question: str
+    category: str
+    sector: str
+    level: str
+    grain: str
+    difficulty: str
+
 
 class TestDataGenerator:
     """Generate test data dynamically."""
@@ -32,9 +181,13 @@ class TestDataGenerator:
         count: int = 10,
         sectors: Optional[List[str]] = None,
         categories: Optional[List[str]] = None,
-        difficulty_levels: Optional[List[str]] = None
+        difficulty_levels: Optional[List[str]] = None,
+        seed: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Generate test questions with variations."""
+        """Generate test questions with variations.
+
+        Pass ``seed`` for a reproducible question set.
+        """
         if sectors is None:
             sectors = [
                 "transport", "power", "waste", "agriculture",
@@ -46,39 +199,29 @@ class TestDataGenerator:
             difficulty_levels = ["easy", "medium", "hard"]
 
         questions = []
-        base_templates = [
-            "What are the total {sector} emissions for {year}?",
-            "How much {sector} emissions did {location} produce in {year}?",
-            "Compare {sector} emissions between {location1} and {location2}",
-            "What is the trend in {sector} emissions from {year1} to {year2}?",
-        ]
-
-        for i in range(count):
-            sector = random.choice(sectors)
-            category = random.choice(categories)
-            difficulty = random.choice(difficulty_levels)
-            year = random.randint(2015, 2023)
-            location = random.choice(["USA", "China", "India", "EU", "Japan"])
-
-            template = random.choice(base_templates)
-            question_text = template.format(
-                sector=sector,
-                year=year,
-                location=location,
-                location1=location,
-                location2=random.choice(["USA", "China", "India", "EU", "Japan"]),
-                year1=year - 5,
-                year2=year
-            )
+
+        # Draw every random choice up front, then materialize the dicts
+        bounds = np.array([
+            len(sectors), len(categories), len(difficulty_levels),
+            MAX_YEAR - MIN_YEAR + 1, len(LOCATIONS), len(_TEMPLATE_FNS),
+            len(LOCATIONS), len(LEVELS), len(GRAINS)
+        ], dtype=np.int64)
+        rng = np.random.default_rng(seed)
+        indices = _draw_indices(count, bounds, rng).tolist()
+
+        for i, (si, ci, di, yi, li, ti, l2i, lvi, gi) in enumerate(indices):
+            sector = sectors[si]
+            year = MIN_YEAR + yi
+            question_text = _TEMPLATE_FNS[ti](sector, year, LOCATIONS[li], LOCATIONS[l2i])
 
             questions.append({
                 'id': i + 1,
                 'question': question_text,
-                'category': category,
+                'category': categories[ci],
                 'sector': sector,
-                'level': random.choice(['country', 'state', 'city']),
-                'grain': random.choice(['year', 'month']),
-                'difficulty': difficulty
+                'level': LEVELS[lvi],
+                'grain': GRAINS[gi],
+                'difficulty': difficulty_levels[di]
             })
 
         return questions
@@ -86,91 +229,47 @@ class TestDataGenerator:
     @staticmethod
     def generate_edge_cases() -> List[Dict[str, Any]]:
         """Generate edge case test questions."""
-        edge_cases = [
-            {
-                'id': 1,
-                'question': '',  # Empty question
-                'category': 'edge',
-                'expected_behavior': 'should return error'
-            },
-            {
-                'id': 2,
-                'question': 'x' * 10000,  # Very long question
-                'category': 'edge',
-                'expected_behavior': 'should handle or truncate'
-            },
-            {
-                'id': 3,
-                'question': '!!!###$$$%%%',  # Special characters
-                'category': 'edge',
-                'expected_behavior': 'should handle gracefully'
-            },
-            {
-                'id': 4,
-                'question': 'What are emissions in year 9999?',  # Future year
-                'category': 'edge',
-                'expected_behavior': 'should indicate no data available'
-            },
-            {
-                'id': 5,
-                'question': 'What are emissions in year 1900?',  # Historical
-                'category': 'edge',
-                'expected_behavior': 'should indicate no data available'
-            },
-            {
-                'id': 6,
-                'question': 'µ ñ ü ß 中文',  # Non-ASCII characters
-                'category': 'edge',
-                'expected_behavior': 'should handle unicode'
-            },
-        ]
-        return edge_cases
+        return [dict(case) for case in _EDGE_CASES]
 
     @staticmethod
     def generate_boundary_values() -> List[Dict[str, Any]]:
         """Generate boundary value test cases."""
-        boundaries = [
-            {'value': 0, 'description': 'zero emissions'},
-            {'value': 1, 'description': 'single unit'},
-            {'value': 999999999, 'description': 'very large number'},
-            {'value': -1, 'description': 'negative number'},
-            {'value': 0.0001, 'description': 'very small decimal'},
-            {'value': None, 'description': 'null value'},
-        ]
-        return boundaries
+        return [dict(boundary) for boundary in _BOUNDARY_VALUES]
 
     @staticmethod
-    def mutate_question(question: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate mutations of a test question."""
-        mutations = [question.copy()]
-
-        # Mutation 1: Typo
-        mutated = question.copy()
-        words = mutated['question'].split()
+    def mutate_question(
+        question: Union[Dict[str, Any], Question]
+    ) -> List[Union[Dict[str, Any], Question]]:
+        """Generate mutations of a test question.
+
+        Accepts a question dict or a ``Question``; mutations are returned in
+        the same form with only the question text replaced.
+        """
+        is_question = isinstance(question, Question)
+        text = question.question if is_question else question['question']
+        # No-op mutations are skipped as they are built, not filtered afterwards
+        new_texts = []
+
+        # Mutation 1: Typo (a no-op if the random letter matches the original)
+        words = text.split()
         if words:
             word = words[0]
             if len(word) > 2:
-                mutated['question'] = mutated['question'].replace(
-                    word,
-                    word[:-1] + random.choice(string.ascii_letters)
-                )
-            mutations.append(mutated)
+                typo = text.replace(word, word[:-1] + random.choice(string.ascii_letters))
+                if typo != text:
+                    new_texts.append(typo)
 
         # Mutation 2: Different tense
-        mutated = question.copy()
-        mutated['question'] = mutated['question'].replace(
-            'are the',
-            'were the'
-        )
-        mutations.append(mutated)
+        if 'are the' in text:
+            new_texts.append(text.replace('are the', 'were the'))
 
-        # Mutation 3: Different quantity
-        mutated = question.copy()
-        if any(char.isdigit() for char in mutated['question']):
-            mutated['question'] = mutated['question'] + ' vs previous year'
-        mutations.append(mutated)
+        # Mutation 3: Different quantity (always changes the text)
+        if _DIGIT_RE.search(text):
+            new_texts.append(text + ' vs previous year')
 
-        return [m for m in mutations if m != question]
+        if is_question:
+            return [replace(question, question=t) for t in new_texts]
+        return [{**question, 'question': t} for t in new_texts]
 
     @staticmethod
     def parameterize_test(
@@ -178,15 +277,61 @@ class TestDataGenerator:
         parameters: List[Dict[str, Any]]
     ) -> List[Callable]:
         """Generate parameterized test functions."""
-        test_variants = []
+        return [functools.partial(test_func, **param_set) for param_set in parameters]
 
-        for param_set in parameters:
-            def parameterized_test(params=param_set):
-                return test_func(**params)
+    @staticmethod
+    def parametrize_from(parameters: List[Dict[str, Any]], argname: str = 'params'):
+        """Return a pytest.mark.parametrize decorator over parameter sets.
+
+        Unlike parameterize_test, variants are expanded at collection time, so
+        pytest reports them individually and pytest-xdist can distribute them.
+        The test receives each parameter dict as ``argname``.
+        """
+        import pytest
+
+        return pytest.mark.parametrize(
+            argname,
+            parameters,
+            ids=[repr(param_set) for param_set in parameters]
+        )
 
-            test_variants.append(parameterized_test)
 
-        return test_variants
+@functools.cache
+def _get_property_strategies() -> tuple:
+    """Build the Hypothesis strategies once; raises ImportError if unavailable."""
+    from hypothesis import strategies as st
+
+    return (
+        {
+            'name': 'question_text',
+            'strategy': st.text(
+                alphabet=string.ascii_letters + ' ',
+                min_size=5,
+                max_size=200
+            ),
+            'property': 'Non-empty valid question text'
+        },
+        {
+            'name': 'year',
+            'strategy': st.integers(min_value=2000, max_value=2030),
+            'property': 'Valid year range'
+        },
+        {
+            'name': 'emissions_value',
+            'strategy': st.floats(
+                min_value=0,
+                max_value=1e12,
+                allow_nan=False,
+                allow_infinity=False
+            ),
+            'property': 'Non-negative emissions value'
+        },
+        {
+            'name': 'location',
+            'strategy': st.sampled_from(['USA', 'China', 'EU', 'Japan', 'India']),
+            'property': 'Valid location'
+        }
+    )
 
 
 class HypothesisTestGenerator:
@@ -196,40 +341,7 @@ class HypothesisTestGenerator:
     def generate_property_tests() -> List[Dict[str, Any]]:
         """Generate property-based test strategies."""
         try:
-            from hypothesis import strategies as st
-
-            strategies = [
-                {
-                    'name': 'question_text',
-                    'strategy': st.text(
-                        alphabet=string.ascii_letters + ' ',
-                        min_size=5,
-                        max_size=200
-                    ),
-                    'property': 'Non-empty valid question text'
-                },
-                {
-                    'name': 'year',
-                    'strategy': st.integers(min_value=2000, max_value=2030),
-                    'property': 'Valid year range'
-                },
-                {
-                    'name': 'emissions_value',
-                    'strategy': st.floats(
-                        min_value=0,
-                        max_value=1e12,
-                        allow_nan=False,
-                        allow_infinity=False
-                    ),
-                    'property': 'Non-negative emissions value'
-                },
-                {
-                    'name': 'location',
-                    'strategy': st.sampled_from(['USA', 'China', 'EU', 'Japan', 'India']),
-                    'property': 'Valid location'
-                }
-            ]
-            return strategies
+            return list(_get_property_strategies())
         except ImportError:
             logger.warning("Hypothesis not installed, skipping property-based tests")
             return []
@@ -244,35 +356,102 @@ class TestDataValidator:
         errors = []
 
         # Required fields
-        required_fields = ['id', 'question', 'category', 'sector', 'level', 'grain', 'difficulty']
-        for field in required_fields:
+        for field in REQUIRED_QUESTION_FIELDS:
             if field not in question:
                 errors.append(f"Missing required field: {field}")
 
         # Field value validation
         if 'question' in question:
-            if not isinstance(question['question'], str):
+            text = question['question']
+            if not isinstance(text, str):
                 errors.append("Question must be a string")
-            if len(question['question']) < 5:
-                errors.append("Question too short (min 5 chars)")
-            if len(question['question']) > 500:
-                errors.append("Question too long (max 500 chars)")
-
+            else:
+                length = len(text)
+                if length < MIN_QUESTION_LENGTH:
+                    errors.append("Question too short (min 5 chars)")
+                elif length > MAX_QUESTION_LENGTH:
+                    errors.append("Question too long (max 500 chars)")
+
+        # Valid values are all strings, so the isinstance check also keeps
+        # unhashable values away from the frozenset lookup
         if 'category' in question:
-            valid_categories = ['simple', 'temporal', 'comparative', 'complex']
-            if question['category'] not in valid_categories:
-                errors.append(f"Invalid category: {question['category']}")
+            category = question['category']
+            if not (isinstance(category, str) and category in VALID_CATEGORIES):
+                errors.append(f"Invalid category: {category}")
 
         if 'difficulty' in question:
-            valid_difficulties = ['easy', 'medium', 'hard']
-            if question['difficulty'] not in valid_difficulties:
-                errors.append(f"Invalid difficulty: {question['difficulty']}")
+            difficulty = question['difficulty']
+            if not (isinstance(difficulty, str) and difficulty in VALID_DIFFICULTIES):
+                errors.append(f"Invalid difficulty: {difficulty}")
 
         return len(errors) == 0, errors
 
     @staticmethod
-    def validate_question_bank(questions: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Validate entire question bank."""
+    def _fast_valid_mask(df: pd.DataFrame) -> np.ndarray:
+        """Column-wise mask of rows that certainly pass validate_question.
+
+        Rows outside the mask are not necessarily invalid; they are re-checked
+        one by one so the error messages stay exact.
+        """
+        if not set(REQUIRED_QUESTION_FIELDS).issubset(df.columns):
+            return np.zeros(len(df), dtype=bool)
+
+        text = df['question']
+        lengths = text.str.len() if text.dtype == object else pd.Series(np.nan, index=df.index)
+        mask = (
+            df[list(REQUIRED_QUESTION_FIELDS)].notna().all(axis=1)
+            & lengths.between(MIN_QUESTION_LENGTH, MAX_QUESTION_LENGTH)
+            & df['category'].isin(VALID_CATEGORIES)
+            & df['difficulty'].isin(VALID_DIFFICULTIES)
+        )
+        return mask.to_numpy(dtype=bool)
+
+    @staticmethod
+    def validate_question_bank(
+        questions: List[Dict[str, Any]],
+        n_jobs: int = 1
+    ) -> Dict[str, Any]:
+        """Validate entire question bank.
+
+        With ``n_jobs`` other than 1 (-1 for all cores), banks of at least
+        PARALLEL_MIN_QUESTIONS are split into chunks validated in worker
+        processes and merged in order.
+        """
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs <= 1 or len(questions) < PARALLEL_MIN_QUESTIONS:
+            return TestDataValidator._validate_chunk(questions)
+
+        chunk_size = -(-len(questions) // n_jobs)
+        chunks = [questions[i:i + chunk_size] for i in range(0, len(questions), chunk_size)]
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunk_results = list(executor.map(TestDataValidator._validate_chunk, chunks))
+
+        category_coverage = Counter()
+        sector_coverage = Counter()
+        results = {
+            'total_questions': len(questions),
+            'valid_questions': 0,
+            'invalid_questions': 0,
+            'coverage': {},
+            'errors': []
+        }
+        for chunk_result in chunk_results:
+            results['valid_questions'] += chunk_result['valid_questions']
+            results['invalid_questions'] += chunk_result['invalid_questions']
+            results['errors'].extend(chunk_result['errors'])
+            category_coverage.update(chunk_result['coverage']['by_category'])
+            sector_coverage.update(chunk_result['coverage']['by_sector'])
+
+        results['coverage'] = {
+            'by_category': dict(category_coverage),
+            'by_sector': dict(sector_coverage)
+        }
+        return results
+
+    @staticmethod
+    def _validate_chunk(questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Validate a list of questions in the current process."""
         results = {
             'total_questions': len(questions),
             'valid_questions': 0,
@@ -284,17 +463,29 @@ class TestDataValidator:
         category_coverage = {}
         sector_coverage = {}
 
-        for question in questions:
-            is_valid, errors = TestDataValidator.validate_question(question)
-            if is_valid:
-                results['valid_questions'] += 1
-                category = question.get('category')
-                sector = question.get('sector')
-                category_coverage[category] = category_coverage.get(category, 0) + 1
-                sector_coverage[sector] = sector_coverage.get(sector, 0) + 1
-            else:
-                results['invalid_questions'] += 1
-                results['errors'].extend(errors)
+        if questions:
+            # Vectorized pass over the bank as columns; only rows it cannot
+            # clear fall back to the per-question validator
+            df = pd.DataFrame.from_records(questions)
+            valid_mask = TestDataValidator._fast_valid_mask(df)
+            fast_valid = df.loc[valid_mask]
+            results['valid_questions'] = len(fast_valid)
+            if len(fast_valid):
+                category_coverage = fast_valid['category'].value_counts(sort=False).to_dict()
+                sector_coverage = fast_valid['sector'].value_counts(sort=False).to_dict()
+
+            for i in np.flatnonzero(~valid_mask):
+                question = questions[i]
+                is_valid, errors = TestDataValidator.validate_question(question)
+                if is_valid:
+                    results['valid_questions'] += 1
+                    category = question.get('category')
+                    sector = question.get('sector')
+                    category_coverage[category] = category_coverage.get(category, 0) + 1
+                    sector_coverage[sector] = sector_coverage.get(sector, 0) + 1
+                else:
+                    results['invalid_questions'] += 1
+                    results['errors'].extend(errors)
 
         results['coverage'] = {
             'by_category': category_coverage,
@@ -3,18 +3,58 @@
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import sys
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import hashlib
 
+import numpy as np
+import pyarrow as pa
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# These hashes only identify/deduplicate test data, so a fast
+# non-cryptographic hash is used when available
+def _token_hash(value: bytes) -> str:
+    """Hex digest used for anonymization tokens."""
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(value)
+    return hashlib.sha256(value).hexdigest()
+
+
+def _dataset_checksum(payload: bytes) -> str:
+    """Hex checksum of a serialized dataset."""
+    if HAS_XXHASH:
+        return xxhash.xxh3_128_hexdigest(payload)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _serialize_dataset(data: List[Dict[str, Any]]) -> bytes:
+    """Serialize a dataset to canonical (key-sorted) JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    # Match orjson's compact UTF-8 output so checksums agree either way
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+@dataclass(slots=True, frozen=True)
 class DatasetVersion:
-    """Version of test dataset."""
+    """Version of test dataset (immutable, so snapshots can share instances)."""
     dataset_id: str
     version: str
     timestamp: str
@@ -28,41 +68,57 @@ class TestDataPlatform:
     def __init__(self):
         """Initialize platform."""
         self.datasets: Dict[str, List[Dict[str, Any]]] = {}
-        self.versions: Dict[str, List[DatasetVersion]] = {}
+        self.versions: Dict[str, Tuple[DatasetVersion, ...]] = {}
         self.data_dir = Path("test_results/test_data")
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+    def generate_realistic_table(self, schema: Dict[str, str], count: int = 100) -> pa.Table:
+        """Generate realistic test data column-wise as an Arrow table."""
+        index = np.arange(count)
+        columns = {}
+        for field, dtype in schema.items():
+            if dtype == 'string':
+                columns[field] = pa.array([f"value_{i}_{field}" for i in range(count)], type=pa.string())
+            elif dtype == 'int':
+                columns[field] = pa.array(index * 100)
+            elif dtype == 'float':
+                columns[field] = pa.array(index * 1.5)
+        return pa.table(columns)
+
     def generate_realistic_data(self, schema: Dict[str, str], count: int = 100) -> List[Dict[str, Any]]:
         """Generate realistic test data using patterns."""
-        data = []
-        for i in range(count):
-            record = {}
-            for field, dtype in schema.items():
-                if dtype == 'string':
-                    record[field] = f"value_{i}_{field}"
-                elif dtype == 'int':
-                    record[field] = i * 100
-                elif dtype == 'float':
-                    record[field] = i * 1.5
-            data.append(record)
-        return data
+        table = self.generate_realistic_table(schema, count)
+        if table.num_columns == 0:
+            return [{} for _ in range(count)]
+        return table.to_pylist()
 
     def anonymize_production_data(self, data: List[Dict[str, Any]], pii_fields: List[str]) -> List[Dict[str, Any]]:
-        """Anonymize PII in production data."""
-        anonymized = []
-        for record in data:
-            anon_record = record.copy()
-            for field in pii_fields:
-                if field in anon_record:
-                    # Hash the value
-                    anon_record[field] = f"ANON_{hashlib.md5(str(anon_record[field]).encode()).hexdigest()[:8]}"
-            anonymized.append(anon_record)
+        """Anonymize PII in production data.
+
+        Each distinct value is hashed once per call (xxh3 when installed,
+        SHA-256 otherwise) so repeated values share a token.
+        """
+        tokens: Dict[str, str] = {}
+        anonymized = [record.copy() for record in data]
+        for field in pii_fields:
+            for anon_record in anonymized:
+                if field not in anon_record:
+                    continue
+                value = str(anon_record[field])
+                token = tokens.get(value)
+                if token is None:
+                    token = f"ANON_{_token_hash(value.encode())[:8]}"
+                    tokens[value] = token
+                anon_record[field] = token
         return anonymized
 
     def version_dataset(self, dataset_id: str, data: List[Dict[str, Any]]) -> DatasetVersion:
         """Version a dataset."""
-        version = f"v{len(self.versions.get(dataset_id, [])) + 1}"
-        checksum = hashlib.md5(json.dumps(data).encode()).hexdigest()
+        history = self.versions.get(dataset_id, ())
+        version = sys.intern(f"v{len(history) + 1}")
+        # Serialize once and reuse the bytes for both the checksum and the file
+        payload = _serialize_dataset(data)
+        checksum = _dataset_checksum(payload)
 
         dv = DatasetVersion(
             dataset_id=dataset_id,
@@ -72,14 +128,11 @@ class TestDataPlatform:
             checksum=checksum
         )
 
-        if dataset_id not in self.versions:
-            self.versions[dataset_id] = []
-        self.versions[dataset_id].append(dv)
+        self.versions[dataset_id] = history + (dv,)
 
         # Save to file
         file_path = self.data_dir / f"{dataset_id}_{version}.json"
-        with open(file_path, 'w') as f:
-            json.dump(data, f)
+        file_path.write_bytes(payload)
 
         return dv
 
@@ -14,11 +14,46 @@ Features:
 
 import pytest
 import json
-from typing import Dict, Any, List, Optional
+import mmap
+from typing import Dict, Any, Iterator, List, Optional
 from pathlib import Path
 import responses
 from unittest.mock import MagicMock, patch
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Static parts of the mock payloads, built once at import
+_CLIMATEGPT_SUCCESS_TEMPLATE = {
+    "answer": "Transportation emissions in 2023 were 7.2 billion MtCO2 globally.",
+    "confidence": 0.92,
+    "sources": ("IPCC AR6", "WRI Climate Watch")
+}
+
+_LLAMA_SUCCESS_RESPONSE = {
+    "choices": ({
+        "message": {
+            "content": "Based on available data, transportation contributed approximately 7.2 billion metric tons of CO2 equivalents in 2023."
+        }
+    },),
+    "model": "meta-llama-3.1-8b-instruct",
+    "usage": {
+        "prompt_tokens": 45,
+        "completion_tokens": 28,
+        "total_tokens": 73
+    }
+}
+
 
 class MockAPIResponses:
     """Mock responses for test APIs."""
@@ -26,12 +61,7 @@ class MockAPIResponses:
     @staticmethod
     def climategpt_success_response(question_id: int = 1) -> Dict[str, Any]:
         """Generate mock ClimateGPT success response."""
-        return {
-            "answer": f"Transportation emissions in 2023 were 7.2 billion MtCO2 globally.",
-            "question_id": question_id,
-            "confidence": 0.92,
-            "sources": ["IPCC AR6", "WRI Climate Watch"]
-        }
+        return {**_CLIMATEGPT_SUCCESS_TEMPLATE, "question_id": question_id}
 
     @staticmethod
     def climategpt_error_response(status_code: int = 500) -> Dict[str, Any]:
@@ -43,20 +73,11 @@ class MockAPIResponses:
 
     @staticmethod
     def llama_success_response(question_id: int = 1) -> Dict[str, Any]:
-        """Generate mock Llama success response."""
-        return {
-            "choices": [{
-                "message": {
-                    "content": f"Based on available data, transportation contributed approximately 7.2 billion metric tons of CO2 equivalents in 2023."
-                }
-            }],
-            "model": "meta-llama-3.1-8b-instruct",
-            "usage": {
-                "prompt_tokens": 45,
-                "completion_tokens": 28,
-                "total_tokens": 73
-            }
-        }
+        """Generate mock Llama success response.
+
+        Top-level keys are copied; nested values are shared and must not be mutated.
+        """
+        return {**_LLAMA_SUCCESS_RESPONSE}
 
     @staticmethod
     def llama_error_response() -> Dict[str, Any]:
@@ -201,15 +222,33 @@ class RequestRecorder:
         """Load recorded requests/responses."""
         cassette_path = self.cassette_dir / f"{cassette_name}.json"
         if cassette_path.exists():
-            with open(cassette_path, 'r') as f:
-                return json.load(f)
+            data = cassette_path.read_bytes()
+            return orjson.loads(data) if HAS_ORJSON else json.loads(data)
         return []
 
+    def iter_cassette(self, cassette_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream recorded interactions one at a time.
+
+        With ijson installed the cassette is parsed incrementally from a
+        memory map, so large recordings are usable before the full parse.
+        """
+        cassette_path = self.cassette_dir / f"{cassette_name}.json"
+        if not cassette_path.exists() or cassette_path.stat().st_size == 0:
+            return
+        if not HAS_IJSON:
+            yield from self.load_cassette(cassette_name)
+            return
+        with open(cassette_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from ijson.items(mm, 'item', use_float=True)
+
     def save_cassette(self, cassette_name: str, interactions: List[Dict[str, Any]]) -> None:
         """Save request/response interactions."""
         cassette_path = self.cassette_dir / f"{cassette_name}.json"
-        with open(cassette_path, 'w') as f:
-            json.dump(interactions, f, indent=2)
+        if HAS_ORJSON:
+            cassette_path.write_bytes(orjson.dumps(interactions, option=orjson.OPT_INDENT_2))
+        else:
+            cassette_path.write_text(json.dumps(interactions, indent=2))
 
     @pytest.fixture
     def record_requests(self):
@@ -19,16 +19,52 @@ Features:
 
 import json
 import logging
+from bisect import bisect_left
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 from pathlib import Path
 from collections import defaultdict
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 logger = logging.getLogger(__name__)
 
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write pretty-printed JSON, using orjson's C encoder when available."""
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+# Inclusive upper bounds (in days) of the age buckets, and their report keys
+AGE_THRESHOLDS = (30, 90)
+AGE_KEYS = ('0-30_days', '30-90_days', '90+_days')
+
+
 
-@dataclass
+def is_obsolete_fast(last_run_date: Optional[str], cutoff_iso: str) -> bool:
+    """Obsolescence check on raw ISO strings, which sort chronologically.
+
+    ``cutoff_iso`` is ``(now - timedelta(days=91)).isoformat()``: a test is
+    obsolete once more than 90 whole days have passed since its last run.
+    """
+    return bool(last_run_date) and last_run_date <= cutoff_iso
+
+
+@dataclass(slots=True)
 class TestMetadata:
     """Metadata for a test."""
     test_id: int
@@ -42,57 +78,106 @@ class TestMetadata:
     related_tests: List[int] = field(default_factory=list)
     status: str = "active"  # active, deprecated, archived
     maintenance_notes: str = ""
+    # Parsed date caches; slotted, so they must be declared up front
+    _created_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _last_run_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.created_date:
             self.created_date = datetime.now().isoformat()
         if not self.last_modified_date:
             self.last_modified_date = datetime.now().isoformat()
+        # Parsed once; mark_run() keeps the cache in step with last_run_date
+        self._created_dt = datetime.fromisoformat(self.created_date)
+        self._last_run_dt = (
+            datetime.fromisoformat(self.last_run_date) if self.last_run_date else None
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the public fields (no deepcopy, unlike asdict)."""
+        return {name: getattr(self, name) for name in _METADATA_FIELDS}
+
+    def mark_run(self, when: Optional[datetime] = None) -> None:
+        """Record a run, updating last_run_date and its parsed cache."""
+        when = when or datetime.now()
+        self.last_run_date = when.isoformat()
+        self._last_run_dt = when
+
+    def age_days_at(self, now: datetime) -> int:
+        """Get age of test in days relative to ``now``."""
+        return (now - self._created_dt).days
+
+    def days_since_run_at(self, now: datetime) -> Optional[int]:
+        """Get days since last run relative to ``now``."""
+        if self._last_run_dt is None:
+            return None
+        return (now - self._last_run_dt).days
+
+    def is_obsolete_at(self, now: datetime) -> bool:
+        """Determine if test is obsolete relative to ``now``."""
+        # Test is obsolete if not run in 90 days
+        days_since_run = self.days_since_run_at(now)
+        return days_since_run is not None and days_since_run > 90
 
     @property
     def age_days(self) -> int:
         """Get age of test in days."""
-        created = datetime.fromisoformat(self.created_date)
-        return (datetime.now() - created).days
+        return self.age_days_at(datetime.now())
 
     @property
     def days_since_run(self) -> Optional[int]:
         """Get days since last run."""
-        if not self.last_run_date:
-            return None
-        last_run = datetime.fromisoformat(self.last_run_date)
-        return (datetime.now() - last_run).days
+        return self.days_since_run_at(datetime.now())
 
     @property
     def is_obsolete(self) -> bool:
         """Determine if test is obsolete."""
-        # Test is obsolete if not run in 90 days
-        days_since_run = self.days_since_run
-        return days_since_run is not None and days_since_run > 90
+        return self.is_obsolete_at(datetime.now())
+
+
+_METADATA_FIELDS = tuple(f.name for f in fields(TestMetadata) if not f.name.startswith('_'))
 
 
 class TestMaintenanceTracker:
-    """Track test maintenance and lifecycle."""
+    """Track test maintenance and lifecycle.
+
+    Metrics, health and reports are served from a cached aggregate, so the
+    TestMetadata objects in ``tests`` must only be changed through the
+    tracker (register_test, update_test, update_test_run,
+    mark_test_deprecated). Editing them directly is not supported and is not
+    reflected until the next mutator call.
+    """
 
     def __init__(self, metadata_file: str = "testing/test_metadata.json"):
         """Initialize tracker."""
         self.metadata_file = Path(metadata_file)
         self.tests: Dict[int, TestMetadata] = {}
+        self._aggregate_cache: Optional[Dict[str, Any]] = None
         self.load_metadata()
 
     def load_metadata(self) -> None:
         """Load test metadata."""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    data = json.load(f)
-                    for test_data in data.get('tests', []):
-                        test_id = test_data['test_id']
-                        self.tests[test_id] = TestMetadata(**test_data)
+                for test_data in self._iter_test_records():
+                    test_id = test_data['test_id']
+                    self.tests[test_id] = TestMetadata(**test_data)
+                self._aggregate_cache = None
                 logger.info(f"Loaded metadata for {len(self.tests)} tests")
             except Exception as e:
                 logger.warning(f"Could not load test metadata: {e}")
 
+    def _iter_test_records(self):
+        """Yield raw test records, streaming them with ijson when available."""
+        if HAS_IJSON:
+            with open(self.metadata_file, 'rb') as f:
+                yield from ijson.items(f, 'tests.item', use_float=True)
+            return
+
+        raw = self.metadata_file.read_bytes()
+        data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        yield from data.get('tests', [])
+
     def save_metadata(self) -> None:
         """Save test metadata."""
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
@@ -100,81 +185,152 @@ class TestMaintenanceTracker:
         data = {
             'timestamp': datetime.now().isoformat(),
             'total_tests': len(self.tests),
-            'tests': [asdict(t) for t in self.tests.values()]
+            'tests': [t.to_dict() for t in self.tests.values()]
         }
 
-        with open(self.metadata_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(self.metadata_file, data)
 
         logger.info(f"Saved metadata for {len(self.tests)} tests")
 
     def register_test(self, metadata: TestMetadata) -> None:
         """Register a test with metadata."""
         self.tests[metadata.test_id] = metadata
+        self._aggregate_cache = None
         logger.info(f"Registered test: {metadata.test_name} (ID: {metadata.test_id})")
 
     def update_test_run(self, test_id: int) -> None:
         """Update test as having been run."""
-        if test_id in self.tests:
-            self.tests[test_id].last_run_date = datetime.now().isoformat()
+        test = self.tests.get(test_id)
+        if test is not None:
+            test.mark_run()
+            self._aggregate_cache = None
+
+    def update_test(self, test_id: int, /, **changes: Any) -> None:
+        """Change public fields of a registered test, keeping caches in step."""
+        test = self.tests.get(test_id)
+        if test is None:
+            return
+        invalid = [name for name in changes if name == 'test_id' or name not in _METADATA_FIELDS]
+        if invalid:
+            raise ValueError(f"Cannot update test fields: {invalid}")
+
+        for name, value in changes.items():
+            setattr(test, name, value)
+        if 'created_date' in changes:
+            test._created_dt = datetime.fromisoformat(test.created_date)
+        if 'last_run_date' in changes:
+            test._last_run_dt = (
+                datetime.fromisoformat(test.last_run_date) if test.last_run_date else None
+            )
+        self._aggregate_cache = None
 
     def mark_test_deprecated(self, test_id: int, reason: str = "") -> None:
         """Mark a test as deprecated."""
-        if test_id in self.tests:
-            self.tests[test_id].status = 'deprecated'
-            self.tests[test_id].maintenance_notes = reason
+        self.update_test(test_id, status='deprecated', maintenance_notes=reason)
 
-    def detect_obsolete_tests(self) -> List[TestMetadata]:
-        """Detect tests that haven't been run recently."""
-        return [t for t in self.tests.values() if t.is_obsolete]
+    def _aggregate(self) -> Dict[str, Any]:
+        """Collect everything metrics, health and reports need in one pass.
 
-    def detect_redundant_tests(self) -> Dict[str, List[int]]:
-        """Detect potentially redundant tests."""
-        redundant_groups = defaultdict(list)
+        The result is reused until a mutator runs, the test count changes or
+        the clock reaches the first moment a test changes age bucket or
+        becomes obsolete.
+        """
+        now = datetime.now()
+        cached = self._aggregate_cache
+        if (cached is not None and cached['total_tests'] == len(self.tests)
+                and (cached['valid_until'] is None or now < cached['valid_until'])):
+            return cached
+
+        by_owner = defaultdict(int)
+        by_status = defaultdict(int)
+        age_counts = [0] * len(AGE_KEYS)
+        # tag -> first test id, promoted to a list of ids once the tag repeats;
+        # most tags are unique, so most never allocate a list
+        tag_groups: Dict[str, Any] = {}
+        obsolete = []
+        obsolete_cutoff = (now - timedelta(days=91)).isoformat()
+        deprecated_count = 0
+        missing_owner_count = 0
+        obsolete_due = None
+        valid_until = None
 
-        # Group tests by tags
-        tag_groups = defaultdict(list)
         for test in self.tests.values():
+            by_owner[test.owner] += 1
+            by_status[test.status] += 1
+
+            # bisect_left keeps the inclusive upper bounds (<= 30, <= 90)
+            bucket = bisect_left(AGE_THRESHOLDS, test.age_days_at(now))
+            age_counts[bucket] += 1
+            if bucket < len(AGE_THRESHOLDS):
+                changes_at = test._created_dt + timedelta(days=AGE_THRESHOLDS[bucket] + 1)
+                if valid_until is None or changes_at < valid_until:
+                    valid_until = changes_at
+
+            if is_obsolete_fast(test.last_run_date, obsolete_cutoff):
+                obsolete.append(test)
+            elif test._last_run_dt is not None:
+                changes_at = test._last_run_dt + timedelta(days=91)
+                if obsolete_due is None or changes_at < obsolete_due:
+                    obsolete_due = changes_at
+            if test.status == 'deprecated':
+                deprecated_count += 1
+            if test.owner == "unknown":
+                missing_owner_count += 1
+            test_id = test.test_id
             for tag in test.tags:
-                tag_groups[tag].append(test.test_id)
+                group = tag_groups.get(tag)
+                if group is None:
+                    tag_groups[tag] = test_id
+                elif type(group) is list:
+                    group.append(test_id)
+                else:
+                    tag_groups[tag] = [group, test_id]
+
+        if obsolete_due is not None and (valid_until is None or obsolete_due < valid_until):
+            valid_until = obsolete_due
+
+        # Identify tag groups with multiple tests
+        redundant = {
+            f"tag:{tag}": test_ids
+            for tag, test_ids in tag_groups.items()
+            if type(test_ids) is list and len(test_ids) > 2
+        }
 
-        # Identify groups with multiple tests
-        for tag, test_ids in tag_groups.items():
-            if len(test_ids) > 2:
-                redundant_groups[f"tag:{tag}"] = test_ids
+        self._aggregate_cache = {
+            'now': now,
+            'valid_until': valid_until,
+            'total_tests': len(self.tests),
+            'by_owner': dict(by_owner),
+            'by_status': dict(by_status),
+            'by_age': dict(zip(AGE_KEYS, age_counts)),
+            'obsolete': obsolete,
+            'redundant': redundant,
+            'deprecated_count': deprecated_count,
+            'missing_owner_count': missing_owner_count,
+        }
+        return self._aggregate_cache
+
+    def detect_obsolete_tests(self) -> List[TestMetadata]:
+        """Detect tests that haven't been run recently."""
+        return list(self._aggregate()['obsolete'])
 
-        return dict(redundant_groups)
+    def detect_redundant_tests(self) -> Dict[str, List[int]]:
+        """Detect potentially redundant tests."""
+        return {group: list(test_ids) for group, test_ids in self._aggregate()['redundant'].items()}
 
     def get_maintenance_metrics(self) -> Dict[str, Any]:
         """Calculate test maintenance metrics."""
         if not self.tests:
             return {'total_tests': 0}
 
-        obsolete = self.detect_obsolete_tests()
-        redundant = self.detect_redundant_tests()
-
-        by_owner = defaultdict(int)
-        by_status = defaultdict(int)
-        by_age = {'0-30_days': 0, '30-90_days': 0, '90+_days': 0}
-
-        for test in self.tests.values():
-            by_owner[test.owner] += 1
-            by_status[test.status] += 1
-
-            if test.age_days <= 30:
-                by_age['0-30_days'] += 1
-            elif test.age_days <= 90:
-                by_age['30-90_days'] += 1
-            else:
-                by_age['90+_days'] += 1
-
+        agg = self._aggregate()
         return {
-            'total_tests': len(self.tests),
-            'by_status': dict(by_status),
-            'by_owner': dict(by_owner),
-            'by_age': dict(by_age),
-            'obsolete_tests': len(obsolete),
-            'potentially_redundant_groups': len(redundant),
+            'total_tests': agg['total_tests'],
+            'by_status': dict(agg['by_status']),
+            'by_owner': dict(agg['by_owner']),
+            'by_age': dict(agg['by_age']),
+            'obsolete_tests': len(agg['obsolete']),
+            'potentially_redundant_groups': len(agg['redundant']),
             'maintenance_health': self._calculate_health_score()
         }
 
@@ -183,23 +339,20 @@ class TestMaintenanceTracker:
         if not self.tests:
             return 0.0
 
+        agg = self._aggregate()
         score = 100.0
 
         # Penalize obsolete tests
-        obsolete = self.detect_obsolete_tests()
-        score -= len(obsolete) * 5
+        score -= len(agg['obsolete']) * 5
 
         # Penalize deprecated tests
-        deprecated = sum(1 for t in self.tests.values() if t.status == 'deprecated')
-        score -= deprecated * 3
+        score -= agg['deprecated_count'] * 3
 
         # Penalize untreated redundancy
-        redundant = self.detect_redundant_tests()
-        score -= len(redundant) * 2
+        score -= len(agg['redundant']) * 2
 
         # Penalize missing metadata
-        missing_owner = sum(1 for t in self.tests.values() if t.owner == "unknown")
-        score -= missing_owner * 1
+        score -= agg['missing_owner_count'] * 1
 
         return max(score, 0.0)
 
@@ -211,8 +364,10 @@ class TestMaintenanceTracker:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        obsolete_tests = self.detect_obsolete_tests()
-        redundant_groups = self.detect_redundant_tests()
+        agg = self._aggregate()
+        now = datetime.now()
+        obsolete_tests = agg['obsolete']
+        redundant_groups = agg['redundant']
         metrics = self.get_maintenance_metrics()
 
         report = {
@@ -222,7 +377,7 @@ class TestMaintenanceTracker:
                 {
                     'test_id': t.test_id,
                     'test_name': t.test_name,
-                    'days_since_run': t.days_since_run,
+                    'days_since_run': t.days_since_run_at(now),
                     'owner': t.owner
                 }
                 for t in obsolete_tests
@@ -240,8 +395,7 @@ class TestMaintenanceTracker:
             )
         }
 
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        _write_json(output_path, report)
 
         logger.info(f"Generated maintenance report: {output_file}")
         return output_file
@@ -11,14 +11,27 @@ Tests the actual functionality of the MCP server tools:
 """
 
 import asyncio
+import functools
+import io
+import itertools
 import json
 import logging
+import mmap
 import os
+import re
 import sys
+import threading
 import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, asdict
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Setup logging
 logging.basicConfig(
@@ -30,7 +43,43 @@ logger = logging.getLogger(__name__)
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-@dataclass
+_REPORT_HEADER = "\n" + "=" * 80 + "\nMCP FUNCTIONAL TEST REPORT\n" + "=" * 80 + "\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_baseline_context_provider():
+    """Import BaselineContextProvider once per process"""
+    from src.utils.baseline_context import BaselineContextProvider
+    return BaselineContextProvider
+
+
+@functools.lru_cache(maxsize=8)
+def _file_has_cache_markers(path: str, mtime: float) -> bool:
+    """Probe a source file for QueryCache without decoding or lowercasing it.
+
+    ``mtime`` is part of the cache key so an edited file is re-scanned.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(b"QueryCache") != -1 and re.search(rb"cache", mm, re.IGNORECASE) is not None
+
+
+# Test names in the order the tests are declared, used to order the report
+_TEST_ORDER = {
+    name: i for i, name in enumerate((
+        "Database Tables",
+        "Query Capability",
+        "Entity Resolution",
+        "Aggregation Capability",
+        "Caching Mechanism",
+        "Error Handling",
+    ))
+}
+
+
+@dataclass(slots=True)
 class FunctionalTestResult:
     """Test result for functional tests"""
     test_name: str
@@ -45,9 +94,16 @@ class FunctionalTestResult:
 class MCPFunctionalTester:
     """Tests MCP server functionality without running full server"""
 
-    def __init__(self):
+    def __init__(self, eager: bool = False):
         self.results: List[FunctionalTestResult] = []
         self.db_path = None
+        self.conn = None
+        self._conn_lock = threading.Lock()
+        self._all_tables: Optional[List[str]] = None
+        # Result log lines are buffered and written in one batch by flush_logs();
+        # eager=True logs each line immediately for interactive debugging
+        self.eager = eager
+        self._log_buf: List[Tuple[int, str]] = []
 
     def log_result(self, test_name: str, category: str, status: str,
                    duration: float, message: str = "", error: str = "", details: Dict = None):
@@ -64,11 +120,60 @@ class MCPFunctionalTester:
         self.results.append(result)
 
         status_emoji = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⏭️"
-        logger.info(f"{status_emoji} {test_name} ({category}): {status} [{duration:.2f}s]")
+        self._emit(logging.INFO, f"{status_emoji} {test_name} ({category}): {status} [{duration:.2f}s]")
         if message:
-            logger.info(f"   → {message}")
+            self._emit(logging.INFO, f"   → {message}")
         if error:
-            logger.error(f"   ✗ {error}")
+            self._emit(logging.ERROR, f"   ✗ {error}")
+
+    def _emit(self, level: int, msg: str):
+        """Queue a log line, or log it straight away in eager mode"""
+        if self.eager:
+            logger.log(level, msg)
+        else:
+            self._log_buf.append((level, msg))
+
+    def flush_logs(self):
+        """Write buffered log lines, one logger call per run of same-level lines"""
+        buf, self._log_buf = self._log_buf, []
+        for level, group in itertools.groupby(buf, key=lambda entry: entry[0]):
+            logger.log(level, "\n".join(msg for _, msg in group))
+
+    def _get_connection(self):
+        """Open the read-only DuckDB connection once and reuse it across tests"""
+        with self._conn_lock:
+            if self.conn is None:
+                import duckdb
+                from dotenv import load_dotenv
+
+                load_dotenv()
+                self.db_path = os.getenv("DUCKDB_PATH", "data/warehouse/climategpt.duckdb")
+                self.conn = duckdb.connect(str(self.db_path), read_only=True)
+            return self.conn
+
+    def _cursor(self):
+        """Per-test cursor; DuckDB cursors are safe to use from concurrent threads"""
+        return self._get_connection().cursor()
+
+    def _list_tables(self) -> List[str]:
+        """Table names in the main schema, fetched once per run (the catalog is read-only)"""
+        with self._conn_lock:
+            if self._all_tables is not None:
+                return self._all_tables
+        tables = self._cursor().execute("""
+            SELECT table_name FROM information_schema.tables
+            WHERE table_schema = 'main'
+            ORDER BY table_name
+        """).fetchall()
+        with self._conn_lock:
+            self._all_tables = [t[0] for t in tables]
+            return self._all_tables
+
+    def close(self) -> None:
+        """Close the shared DuckDB connection"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
 
     async def test_database_tables(self) -> bool:
         """Test database table structure"""
@@ -78,22 +183,8 @@ class MCPFunctionalTester:
 
         start = time.time()
         try:
-            import duckdb
-            from dotenv import load_dotenv
-
-            load_dotenv()
-            db_path = os.getenv("DUCKDB_PATH", "data/warehouse/climategpt.duckdb")
-
-            conn = duckdb.connect(str(db_path), read_only=True)
-
             # Check key tables
-            tables = conn.execute("""
-                SELECT table_name FROM information_schema.tables
-                WHERE table_schema = 'main'
-                ORDER BY table_name
-            """).fetchall()
-
-            table_names = [t[0] for t in tables]
+            table_names = self._list_tables()
 
             # Expected tables
             expected_patterns = ["transport", "power", "waste", "agriculture", "buildings"]
@@ -120,33 +211,20 @@ class MCPFunctionalTester:
             self.log_result("Database Tables", "Database", "FAIL", duration, error=str(e))
             return False
 
-    async def test_query_capability(self) -> bool:
+    def test_query_capability(self) -> bool:
         """Test basic query capability"""
         logger.info("\nTest 1.2: Query Capability...")
         start = time.time()
 
         try:
-            import duckdb
-            from dotenv import load_dotenv
-
-            load_dotenv()
-            db_path = os.getenv("DUCKDB_PATH", "data/warehouse/climategpt.duckdb")
-
-            conn = duckdb.connect(str(db_path), read_only=True)
+            conn = self._cursor()
 
             # Try to query a specific sector
             # Looking for transport data at country level
-            query = """
-                SELECT * FROM (
-                    SELECT table_name FROM information_schema.tables
-                    WHERE table_schema = 'main' AND table_name LIKE '%transport%'
-                    LIMIT 1
-                ) t
-            """
-            result = conn.execute(query).fetchall()
+            result = [t for t in self._list_tables() if 'transport' in t]
 
             if result:
-                table_name = result[0][0]
+                table_name = result[0]
 
                 # Query this table
                 query = f"""
@@ -170,23 +248,30 @@ class MCPFunctionalTester:
             self.log_result("Query Capability", "Database", "FAIL", duration, error=str(e))
             return False
 
-    async def test_entity_resolution(self) -> bool:
+    def test_entity_resolution(self) -> bool:
         """Test entity resolution functionality"""
         logger.info("\nTest 1.3: Entity Resolution...")
         start = time.time()
 
         try:
-            from src.utils.baseline_context import BaselineContextProvider
+            provider_cls = _load_baseline_context_provider()
 
-            provider = BaselineContextProvider()
+            # Only build the provider when there is something to exercise
+            if not hasattr(provider_cls, "resolve"):
+                duration = time.time() - start
+                self.log_result("Entity Resolution", "Data Processing", "SKIP", duration,
+                              message="entity resolution not implemented; pending test")
+                return True
+
+            provider = provider_cls()
 
             # Test with common entities
             test_entities = ["Germany", "United States", "London"]
             resolved = 0
 
             for entity in test_entities:
-                # Try to resolve the entity
-                # (The actual implementation may vary)
+                result = provider.resolve(entity)
+                assert result, f"Could not resolve entity: {entity}"
                 resolved += 1
 
             duration = time.time() - start
@@ -199,29 +284,19 @@ class MCPFunctionalTester:
             self.log_result("Entity Resolution", "Data Processing", "FAIL", duration, error=str(e))
             return False
 
-    async def test_aggregation_capability(self) -> bool:
+    def test_aggregation_capability(self) -> bool:
         """Test aggregation and grouping capability"""
         logger.info("\nTest 1.4: Aggregation Capability...")
         start = time.time()
 
         try:
-            import duckdb
-            from dotenv import load_dotenv
-
-            load_dotenv()
-            db_path = os.getenv("DUCKDB_PATH", "data/warehouse/climategpt.duckdb")
-
-            conn = duckdb.connect(str(db_path), read_only=True)
+            conn = self._cursor()
 
             # Try aggregation query
-            tables = conn.execute("""
-                SELECT table_name FROM information_schema.tables
-                WHERE table_schema = 'main'
-                LIMIT 1
-            """).fetchall()
+            tables = self._list_tables()
 
             if tables:
-                table_name = tables[0][0]
+                table_name = tables[0]
 
                 # Try aggregation
                 query = f"""
@@ -248,7 +323,7 @@ class MCPFunctionalTester:
             self.log_result("Aggregation Capability", "Data Processing", "FAIL", duration, error=str(e))
             return False
 
-    async def test_caching_mechanism(self) -> bool:
+    def test_caching_mechanism(self) -> bool:
         """Test query caching mechanism"""
         logger.info("\nTest 1.5: Caching Mechanism...")
         start = time.time()
@@ -256,9 +331,8 @@ class MCPFunctionalTester:
         try:
             # Check if caching-related code exists
             cache_file = Path("src/mcp_server_stdio.py")
-            content = cache_file.read_text()
 
-            if "QueryCache" in content and "cache" in content.lower():
+            if _file_has_cache_markers(str(cache_file), cache_file.stat().st_mtime):
                 duration = time.time() - start
                 self.log_result("Caching Mechanism", "Data Processing", "PASS", duration,
                               message="QueryCache class found in MCP server")
@@ -274,19 +348,14 @@ class MCPFunctionalTester:
             self.log_result("Caching Mechanism", "Data Processing", "FAIL", duration, error=str(e))
             return False
 
-    async def test_error_handling(self) -> bool:
+    def test_error_handling(self) -> bool:
         """Test error handling in database operations"""
         logger.info("\nTest 1.6: Error Handling...")
         start = time.time()
 
         try:
-            import duckdb
-            from dotenv import load_dotenv
-
-            load_dotenv()
-            db_path = os.getenv("DUCKDB_PATH", "data/warehouse/climategpt.duckdb")
-
-            conn = duckdb.connect(str(db_path), read_only=True)
+            # Own cursor so the failing statement can't affect the shared connection
+            conn = self._cursor()
 
             # Try intentionally invalid query
             try:
@@ -311,53 +380,80 @@ class MCPFunctionalTester:
     async def run_all_tests(self) -> bool:
         """Run all functional tests"""
         try:
+            # Validates the database first; the remaining tests are independent
             await self.test_database_tables()
-            await self.test_query_capability()
-            await self.test_entity_resolution()
-            await self.test_aggregation_capability()
-            await self.test_caching_mechanism()
-            await self.test_error_handling()
-            return True
+
+            # The test bodies block (DuckDB queries, imports, file reads), so
+            # each runs in a worker thread to let them overlap
+            independent_tests = (
+                self.test_query_capability,
+                self.test_entity_resolution,
+                self.test_aggregation_capability,
+                self.test_caching_mechanism,
+                self.test_error_handling,
+            )
+            outcomes = await asyncio.gather(
+                *(asyncio.to_thread(test) for test in independent_tests),
+                return_exceptions=True
+            )
+            # Threads finish in any order; report results in declaration order
+            self.results.sort(key=lambda r: _TEST_ORDER.get(r.test_name, len(_TEST_ORDER)))
+
+            failed = False
+            for test, outcome in zip(independent_tests, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"{test.__name__} raised: {outcome!r}")
+                    failed = True
+            return not failed
         except Exception as e:
             logger.error(f"Test runner failed: {e}")
             return False
+        finally:
+            self.close()
+            self.flush_logs()
 
     def generate_report(self) -> str:
         """Generate test report"""
-        report = []
-        report.append("\n" + "="*80)
-        report.append("MCP FUNCTIONAL TEST REPORT")
-        report.append("="*80 + "\n")
+        buf = io.StringIO(_REPORT_HEADER)
+        buf.seek(0, io.SEEK_END)
+        w = buf.write
 
+        # One pass over the results for all status counts
+        counts = Counter(r.status for r in self.results)
+        passed, failed, skipped = counts["PASS"], counts["FAIL"], counts["SKIP"]
         total = len(self.results)
-        passed = len([r for r in self.results if r.status == "PASS"])
-        failed = len([r for r in self.results if r.status == "FAIL"])
-        skipped = len([r for r in self.results if r.status == "SKIP"])
-
-        report.append("SUMMARY")
-        report.append("-" * 40)
-        report.append(f"Total Tests:   {total}")
-        report.append(f"Passed:        {passed} ✅")
-        report.append(f"Failed:        {failed} ❌")
-        report.append(f"Skipped:       {skipped} ⏭️")
+
+        w("\nSUMMARY")
+        w("\n" + "-" * 40)
+        w(f"\nTotal Tests:   {total}")
+        w(f"\nPassed:        {passed} ✅")
+        w(f"\nFailed:        {failed} ❌")
+        w(f"\nSkipped:       {skipped} ⏭️")
         if total > 0:
-            report.append(f"Success Rate:  {(passed/total*100):.1f}%\n")
+            w(f"\nSuccess Rate:  {(passed/total*100):.1f}%\n")
 
         # Detailed results
-        report.append("\nDETAILED RESULTS")
-        report.append("-" * 40)
+        w("\n\nDETAILED RESULTS")
+        w("\n" + "-" * 40)
         for result in self.results:
             status_icon = "✅" if result.status == "PASS" else "❌" if result.status == "FAIL" else "⏭️"
-            report.append(f"{status_icon} {result.test_name:<40} [{result.duration:.2f}s]")
+            w(f"\n{status_icon} {result.test_name:<40} [{result.duration:.2f}s]")
             if result.message:
-                report.append(f"   → {result.message}")
+                w(f"\n   → {result.message}")
             if result.error:
-                report.append(f"   ✗ {result.error}")
+                w(f"\n   ✗ {result.error}")
             if result.details:
                 for key, value in result.details.items():
-                    report.append(f"   • {key}: {value}")
+                    w(f"\n   • {key}: {value}")
+
+        return buf.getvalue()
 
-        return "\n".join(report)
+    def generate_report_json(self) -> str:
+        """Generate machine-readable test report (skips the text formatting)"""
+        results = [asdict(r) for r in self.results]
+        if HAS_ORJSON:
+            return orjson.dumps(results).decode()
+        return json.dumps(results)
 
 
 async def main():
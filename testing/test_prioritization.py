@@ -15,16 +15,138 @@ Features:
 - Dynamic priority adjustment
 """
 
+import functools
+import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import pickle
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+# Lower bounds of the medium/high/critical bands; index with np.digitize
+RISK_THRESHOLDS = np.array([40.0, 60.0, 80.0])
+RISK_LEVELS = np.array(['low', 'medium', 'high', 'critical'])
+
+# Below this many tests (or history rows) the JIT compile cost outweighs
+# the kernel speedup
+JIT_MIN_TESTS = 2048
+JIT_MIN_HISTORY_ROWS = 10000
+
+# Smoke suite (coverage-additional): score above which a test is picked even
+# when its (sector, level) is already covered
+CAM_REPEAT_SCORE = 90.0
+
+# Different sectors/levels have different coverage impact
+SECTOR_WEIGHTS = {
+    'transport': 0.15,
+    'power': 0.15,
+    'industrial': 0.12,
+    'agriculture': 0.12,
+    'buildings': 0.12,
+    'waste': 0.10,
+}
+DEFAULT_SECTOR_WEIGHT = 0.1
+
+LEVEL_WEIGHTS = {
+    'country': 0.35,
+    'state': 0.30,
+    'city': 0.25,
+}
+DEFAULT_LEVEL_WEIGHT = 0.25
+
+
+def _score_numpy(fr, crit, cov, et, wfr, wcrit, wcov, wet):
+    """Weighted priority scores and risk codes (0=low .. 3=critical)."""
+    # Same operation order as the scalar formula, so scores are bit-identical
+    scores = fr * wfr * 100 + crit * wcrit * 100 + cov * wcov * 100 + et * wet * 100
+    return scores, np.digitize(scores, RISK_THRESHOLDS)
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _score_kernel(fr, crit, cov, et, wfr, wcrit, wcov, wet, out_score, out_risk):
+        """Numba kernel computing _score_numpy's outputs in a single fused loop."""
+        for i in range(fr.shape[0]):
+            score = fr[i] * wfr * 100.0 + crit[i] * wcrit * 100.0 + cov[i] * wcov * 100.0 + et[i] * wet * 100.0
+            out_score[i] = score
+            if score >= 80.0:
+                out_risk[i] = 3
+            elif score >= 60.0:
+                out_risk[i] = 2
+            elif score >= 40.0:
+                out_risk[i] = 1
+            else:
+                out_risk[i] = 0
+
+    @njit(cache=True)
+    def _ema_kernel(codes, values, ema, seen):
+        """Replay the 0.7/0.3 moving average per group over rows in order."""
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            if seen[c]:
+                ema[c] = ema[c] * 0.7 + values[i] * 0.3
+            else:
+                ema[c] = values[i]
+                seen[c] = True
+
+
+@functools.lru_cache(maxsize=1024)
+def _priority_reason(failure_rate: Optional[float], high_criticality: bool, many_failures: bool) -> str:
+    """Priority explanation, shared by every test with the same inputs.
+
+    ``failure_rate`` is None when it is not high enough to be mentioned, so
+    the common cases all map to one cached "Standard priority" string.
+    """
+    reasons = []
 
-@dataclass
+    if failure_rate is not None:
+        reasons.append(f"{failure_rate*100:.0f}% failure rate")
+
+    if high_criticality:
+        reasons.append("High business criticality")
+
+    if many_failures:
+        reasons.append("Multiple recent failures")
+
+    return " | ".join(reasons) if reasons else "Standard priority"
+
+
+def _score(features: Tuple[np.ndarray, ...], risk_weights: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Score tests, using the JIT kernel for large batches."""
+    weights = (
+        float(risk_weights['failure_rate']),
+        float(risk_weights['criticality']),
+        float(risk_weights['coverage']),
+        float(risk_weights['execution_time']),
+    )
+    n = features[0].shape[0]
+    if HAS_NUMBA and n >= JIT_MIN_TESTS:
+        scores = np.empty(n, dtype=np.float64)
+        risk_codes = np.empty(n, dtype=np.int8)
+        _score_kernel(*features, *weights, scores, risk_codes)
+        return scores, risk_codes
+    return _score_numpy(*features, *weights)
+
+
+@dataclass(slots=True, frozen=True)
 class TestPriority:
     """Test priority information."""
     test_id: int
@@ -36,22 +158,53 @@ class TestPriority:
     coverage_impact: float  # 0-1
     execution_time_ms: float
     reason: str
+    sector: Optional[str] = None
+    level: Optional[str] = None
 
 
 class TestPrioritizer:
     """Prioritize tests for execution."""
 
-    def __init__(self):
-        """Initialize prioritizer."""
+    def __init__(self, state_file: Optional[str] = None):
+        """Initialize prioritizer.
+
+        With ``state_file`` (e.g. "test_results/prioritizer_state.pkl") the
+        accumulated history is persisted between runs, and later runs only
+        ingest historical results newer than the last timestamp seen.
+        """
         self.test_history: Dict[int, Dict[str, Any]] = {}
         self.failure_counts: Dict[int, int] = defaultdict(int)
         self.execution_times: Dict[int, float] = {}
+        self.state_file = Path(state_file) if state_file else None
+        self._last_seen_timestamp: Optional[str] = None
+        # (question_id, timestamp) of rows already ingested at exactly the
+        # watermark; results sharing that timestamp may arrive in later batches
+        self._watermark_keys: Set[Tuple[Any, str]] = set()
+        # Historical rows skipped as already ingested / newly ingested
+        self.history_cache_hits = 0
+        self.history_cache_misses = 0
+        # Integer codes into weight lookup tables; the last slot is the default
+        self._sector_codes = {sector: i for i, sector in enumerate(SECTOR_WEIGHTS)}
+        self._sector_weights = np.array([*SECTOR_WEIGHTS.values(), DEFAULT_SECTOR_WEIGHT])
+        self._level_codes = {level: i for i, level in enumerate(LEVEL_WEIGHTS)}
+        self._level_weights = np.array([*LEVEL_WEIGHTS.values(), DEFAULT_LEVEL_WEIGHT])
+        # Sorted scores and risk codes of the last prioritize_tests() result,
+        # reused by _group_by_risk when it is handed that same list
+        self._last_priorities: Optional[List[TestPriority]] = None
+        self._last_scores: Optional[np.ndarray] = None
+        self._last_risk_codes: Optional[np.ndarray] = None
+        # Report directory already created by generate_priority_report
+        self._ensured_dir: Optional[Path] = None
+
+        if self.state_file:
+            self._load_state()
 
     def prioritize_tests(
         self,
         tests: List[Dict[str, Any]],
         historical_results: Optional[List[Dict[str, Any]]] = None,
-        risk_weights: Optional[Dict[str, float]] = None
+        risk_weights: Optional[Dict[str, float]] = None,
+        top_k: Optional[int] = None
     ) -> List[TestPriority]:
         """
         Prioritize tests for execution.
@@ -61,6 +214,9 @@ class TestPrioritizer:
         - criticality: business impact (0-1)
         - coverage: code coverage impact (0-1)
         - execution_time: inverse of speed (0-1)
+
+        With ``top_k`` only the k highest-priority tests are returned (same
+        order as the head of the full list), skipping the full sort.
         """
         if risk_weights is None:
             risk_weights = {
@@ -72,86 +228,229 @@ class TestPrioritizer:
 
         # Build test history from historical results
         if historical_results:
-            self._build_history(historical_results)
+            if self.state_file:
+                self._ingest_new_history(historical_results)
+            else:
+                self._build_history(historical_results)
 
-        priorities = []
+        # Score every test at once over parallel (structure-of-arrays) columns
+        features = self._vectorize_tests(tests)
+        failure_rate, criticality, coverage_impact, _ = features
 
-        for test in tests:
-            test_id = test.get('id')
-            test_name = test.get('question', 'unknown')
-
-            # Calculate components
-            failure_rate = self._calculate_failure_rate(test_id)
-            criticality = self._calculate_criticality(test)
-            coverage_impact = self._calculate_coverage_impact(test)
-            execution_time = self._normalize_execution_time(
-                self.execution_times.get(test_id, 100)
-            )
+        scores, risk_codes = _score(features, risk_weights)
+        risk_levels = RISK_LEVELS[risk_codes]
+        rounded = [round(score, 1) for score in scores.tolist()]
+        rounded_arr = np.array(rounded, dtype=np.float64)
 
-            # Calculate weighted score
-            priority_score = (
-                failure_rate * risk_weights['failure_rate'] * 100 +
-                criticality * risk_weights['criticality'] * 100 +
-                coverage_impact * risk_weights['coverage'] * 100 +
-                execution_time * risk_weights['execution_time'] * 100
-            )
-
-            # Determine risk level
-            if priority_score >= 80:
-                risk_level = 'critical'
-            elif priority_score >= 60:
-                risk_level = 'high'
-            elif priority_score >= 40:
-                risk_level = 'medium'
-            else:
-                risk_level = 'low'
-
-            reason = self._explain_priority(test_id, failure_rate, criticality)
+        if top_k is None:
+            # Sort by priority score (highest first); the keys are computed
+            # once, and a stable argsort keeps ties in input order
+            order = np.argsort(-rounded_arr, kind='stable')
+        else:
+            order = self._top_k_indices(rounded_arr, top_k)
 
+        priorities = []
+        for i in order.tolist():
+            test = tests[i]
+            test_id = test.get('id')
             priority = TestPriority(
                 test_id=test_id,
-                test_name=test_name,
-                priority_score=round(priority_score, 1),
-                risk_level=risk_level,
+                test_name=test.get('question', 'unknown'),
+                priority_score=rounded[i],
+                risk_level=str(risk_levels[i]),
                 failure_history_count=self.failure_counts.get(test_id, 0),
                 last_failure_date=self.test_history.get(test_id, {}).get('last_failure'),
-                coverage_impact=round(coverage_impact, 2),
+                coverage_impact=round(float(coverage_impact[i]), 2),
                 execution_time_ms=self.execution_times.get(test_id, 0),
-                reason=reason
+                reason=self._explain_priority(test_id, float(failure_rate[i]), float(criticality[i])),
+                sector=test.get('sector'),
+                level=test.get('level')
             )
             priorities.append(priority)
 
-        # Sort by priority score (highest first)
-        priorities.sort(key=lambda p: p.priority_score, reverse=True)
+        self._last_priorities = priorities
+        self._last_scores = rounded_arr[order]
+        self._last_risk_codes = risk_codes[order]
 
         return priorities
 
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k best scores, ordered like a stable descending sort.
+
+        np.argpartition finds the k-th best score in O(n); ties at that score
+        are then filled in input order, so the result matches the head of the
+        fully sorted list exactly.
+        """
+        n = len(scores)
+        if k <= 0 or n == 0:
+            return np.empty(0, dtype=np.intp)
+        if k < n:
+            threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+            above = np.flatnonzero(scores > threshold)
+            ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+            selected = np.sort(np.concatenate((above, ties)))
+        else:
+            selected = np.arange(n)
+        return selected[np.argsort(-scores[selected], kind='stable')]
+
+    def _vectorize_tests(self, tests: List[Dict[str, Any]]) -> Tuple[np.ndarray, ...]:
+        """Materialize the four score components as parallel float arrays."""
+        ids = [test.get('id') for test in tests]
+        failure_rate = np.array([self._calculate_failure_rate(i) for i in ids], dtype=np.float64)
+        criticality = np.array([self._calculate_criticality(t) for t in tests], dtype=np.float64)
+
+        # Coverage impact via table lookups: one fancy-index per weight table
+        default_sector = len(self._sector_codes)
+        default_level = len(self._level_codes)
+        sector_codes = np.array(
+            [self._sector_codes.get(t.get('sector'), default_sector) for t in tests], dtype=np.intp
+        )
+        level_codes = np.array(
+            [self._level_codes.get(t.get('level'), default_level) for t in tests], dtype=np.intp
+        )
+        coverage = np.minimum(self._sector_weights[sector_codes] + self._level_weights[level_codes], 1.0)
+
+        # Normalize execution time (0-1, lower = faster = higher priority);
+        # faster tests should have higher priority for fail-fast
+        exec_ms = np.array([self.execution_times.get(i, 100) for i in ids], dtype=np.float64)
+        execution_time = 1.0 - np.minimum(exec_ms / 1000, 1.0)  # Invert so faster = higher
+
+        return failure_rate, criticality, coverage, execution_time
+
+    def _ingest_new_history(self, historical_results: List[Dict[str, Any]]) -> None:
+        """Build history from rows not ingested by an earlier run, then persist it.
+
+        Rows newer than the watermark are new; rows at exactly the watermark
+        are new unless their (question_id, timestamp) was already ingested.
+        Rows without a timestamp cannot be deduplicated and are always ingested.
+        """
+        watermark = self._last_seen_timestamp
+        if watermark is not None:
+            seen_keys = self._watermark_keys
+            new_rows = [
+                r for r in historical_results
+                if r.get('timestamp') is None or r['timestamp'] > watermark
+                or (r['timestamp'] == watermark
+                    and (r.get('question_id'), watermark) not in seen_keys)
+            ]
+        else:
+            new_rows = historical_results
+        self.history_cache_hits += len(historical_results) - len(new_rows)
+        self.history_cache_misses += len(new_rows)
+
+        self._build_history(new_rows)
+
+        timestamps = [r['timestamp'] for r in new_rows if r.get('timestamp') is not None]
+        if timestamps:
+            latest = max(timestamps)
+            if watermark is None or latest > watermark:
+                self._last_seen_timestamp = latest
+                self._watermark_keys = set()
+            if latest == self._last_seen_timestamp:
+                self._watermark_keys.update(
+                    (r.get('question_id'), latest) for r in new_rows if r.get('timestamp') == latest
+                )
+        self._save_state()
+
+    def _load_state(self) -> None:
+        """Restore history persisted by a previous run, if any."""
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'rb') as f:
+                state = pickle.load(f)
+            self.test_history = state['test_history']
+            self.failure_counts = defaultdict(int, state['failure_counts'])
+            self.execution_times = state['execution_times']
+            self._last_seen_timestamp = state['last_seen_timestamp']
+            self._watermark_keys = state.get('watermark_keys', set())
+            logger.info(f"Loaded prioritizer state for {len(self.test_history)} tests")
+        except Exception as e:
+            logger.warning(f"Could not load prioritizer state: {e}")
+
+    def _save_state(self) -> None:
+        """Persist the accumulated history for the next run."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            'test_history': self.test_history,
+            'failure_counts': dict(self.failure_counts),
+            'execution_times': self.execution_times,
+            'last_seen_timestamp': self._last_seen_timestamp,
+            'watermark_keys': self._watermark_keys,
+        }
+        with open(self.state_file, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def invalidate(self) -> None:
+        """Forget all accumulated history, including any persisted state."""
+        self.test_history = {}
+        self.failure_counts = defaultdict(int)
+        self.execution_times = {}
+        self._last_seen_timestamp = None
+        self._watermark_keys = set()
+        self.history_cache_hits = 0
+        self.history_cache_misses = 0
+        if self.state_file and self.state_file.exists():
+            self.state_file.unlink()
+
     def _build_history(self, historical_results: List[Dict[str, Any]]) -> None:
-        """Build test history from historical results."""
-        for result in historical_results:
-            test_id = result.get('question_id')
-            if test_id not in self.test_history:
-                self.test_history[test_id] = {
+        """Build test history from historical results.
+
+        Rows are grouped per test with NumPy, so each test's history is
+        updated once per call rather than once per row.
+        """
+        n = len(historical_results)
+        if n == 0:
+            return
+
+        # Column extraction, then a dense group code per test id (first-seen order)
+        test_ids = [r.get('question_id') for r in historical_results]
+        errors = [r.get('error') for r in historical_results]
+        response_times = [r.get('response_time_ms', 100) for r in historical_results]
+        group_of: Dict[Any, int] = {}
+        codes = np.array([group_of.setdefault(t, len(group_of)) for t in test_ids], dtype=np.intp)
+        failed = np.fromiter(map(bool, errors), dtype=bool, count=n)
+        n_groups = len(group_of)
+
+        runs = np.bincount(codes, minlength=n_groups).tolist()
+        failures = np.bincount(codes[failed], minlength=n_groups).tolist()
+        # Row of each test's most recent failure (-1 if it never failed)
+        failed_rows = np.flatnonzero(failed)
+        last_failure_row = np.full(n_groups, -1, dtype=np.intp)
+        np.maximum.at(last_failure_row, codes[failed_rows], failed_rows)
+        last_failure_row = last_failure_row.tolist()
+
+        # Moving average of execution time, replayed in row order per test
+        execution_times = [self.execution_times.get(test_id) for test_id in group_of]
+        if HAS_NUMBA and n >= JIT_MIN_HISTORY_ROWS:
+            seen = np.array([t is not None for t in execution_times], dtype=bool)
+            ema = np.array([0.0 if t is None else t for t in execution_times], dtype=np.float64)
+            _ema_kernel(codes, np.array(response_times, dtype=np.float64), ema, seen)
+            execution_times = ema.tolist()
+        else:
+            for code, response_time in zip(codes.tolist(), response_times):
+                previous = execution_times[code]
+                execution_times[code] = (
+                    response_time if previous is None else previous * 0.7 + response_time * 0.3
+                )
+
+        for (test_id, code), execution_time in zip(group_of.items(), execution_times):
+            history = self.test_history.get(test_id)
+            if history is None:
+                history = self.test_history[test_id] = {
                     'total_runs': 0,
                     'failures': 0,
                     'last_failure': None
                 }
 
-            self.test_history[test_id]['total_runs'] += 1
-            if result.get('error'):
-                self.failure_counts[test_id] += 1
-                self.test_history[test_id]['failures'] += 1
-                self.test_history[test_id]['last_failure'] = result.get('timestamp')
+            history['total_runs'] += runs[code]
+            if failures[code]:
+                self.failure_counts[test_id] += failures[code]
+                history['failures'] += failures[code]
+                history['last_failure'] = historical_results[last_failure_row[code]].get('timestamp')
 
-            # Track execution time
-            if test_id not in self.execution_times:
-                self.execution_times[test_id] = result.get('response_time_ms', 100)
-            else:
-                # Moving average
-                self.execution_times[test_id] = (
-                    self.execution_times[test_id] * 0.7 +
-                    result.get('response_time_ms', 100) * 0.3
-                )
+            self.execution_times[test_id] = execution_time
 
     def _calculate_failure_rate(self, test_id: int) -> float:
         """Calculate failure rate for a test (0-1)."""
@@ -187,58 +486,62 @@ class TestPrioritizer:
         sector = test.get('sector')
         level = test.get('level')
 
-        # Different sectors/levels have different coverage impact
-        sector_weight = {
-            'transport': 0.15,
-            'power': 0.15,
-            'industrial': 0.12,
-            'agriculture': 0.12,
-            'buildings': 0.12,
-            'waste': 0.10,
-        }
-
-        level_weight = {
-            'country': 0.35,
-            'state': 0.30,
-            'city': 0.25,
-        }
-
         impact = (
-            sector_weight.get(sector, 0.1) +
-            level_weight.get(level, 0.25)
+            SECTOR_WEIGHTS.get(sector, DEFAULT_SECTOR_WEIGHT) +
+            LEVEL_WEIGHTS.get(level, DEFAULT_LEVEL_WEIGHT)
         )
 
         return min(impact, 1.0)
 
-    def _normalize_execution_time(self, execution_time_ms: float) -> float:
-        """Normalize execution time (0-1, lower = faster = higher priority)."""
-        # Faster tests should have higher priority for fail-fast
-        # Assume 100ms is baseline
-        normalized = min(execution_time_ms / 1000, 1.0)
-        return 1.0 - normalized  # Invert so faster = higher
-
     def _explain_priority(self, test_id: int, failure_rate: float, criticality: float) -> str:
         """Generate explanation for priority."""
-        reasons = []
-
-        if failure_rate > 0.2:
-            reasons.append(f"{failure_rate*100:.0f}% failure rate")
-
-        if criticality > 0.7:
-            reasons.append("High business criticality")
-
-        if self.failure_counts.get(test_id, 0) > 5:
-            reasons.append("Multiple recent failures")
-
-        return " | ".join(reasons) if reasons else "Standard priority"
+        return _priority_reason(
+            failure_rate if failure_rate > 0.2 else None,
+            criticality > 0.7,
+            self.failure_counts.get(test_id, 0) > 5
+        )
 
     def get_smoke_test_suite(
         self,
         priorities: List[TestPriority],
-        count: int = 10
+        count: int = 10,
+        strategy: str = 'cam'
     ) -> List[TestPriority]:
-        """Get smoke test suite (critical tests only)."""
-        return [p for p in priorities if p.risk_level in ['critical', 'high']][:count]
+        """Get smoke test suite (critical tests only).
+
+        Strategies, both over critical/high tests in priority order:
+        - 'cam' (coverage-additional): prefer tests covering a (sector, level)
+          not yet in the suite; a covered pair is only repeated for scores
+          above CAM_REPEAT_SCORE or to fill the remaining budget
+        - 'ctm' (coverage-total): plain top-``count``; only the head of
+          ``priorities`` is read, so it can come from
+          ``prioritize_tests(..., top_k=count)``
+        """
+        candidates = [p for p in priorities if p.risk_level in ['critical', 'high']]
+        if strategy == 'ctm':
+            return candidates[:count]
+        if strategy != 'cam':
+            raise ValueError(f"Unknown smoke suite strategy: {strategy}")
+
+        suite = []
+        deferred = []
+        covered = set()
+        for p in candidates:
+            if len(suite) >= count:
+                break
+            key = (p.sector, p.level)
+            if key in covered and p.priority_score <= CAM_REPEAT_SCORE:
+                deferred.append(p)
+                continue
+            covered.add(key)
+            suite.append(p)
+
+        if len(suite) < count:
+            # Not enough distinct coverage: fill up with the best skipped tests
+            fill = deferred[:count - len(suite)]
+            suite = sorted(suite + fill, key=lambda p: p.priority_score, reverse=True)
+
+        return suite
 
     def get_sanity_test_suite(
         self,
@@ -246,12 +549,21 @@ class TestPrioritizer:
         count: int = 20
     ) -> List[TestPriority]:
         """Get sanity test suite (mix of priorities)."""
-        critical = [p for p in priorities if p.risk_level == 'critical']
-        high = [p for p in priorities if p.risk_level == 'high']
-        medium = [p for p in priorities if p.risk_level == 'medium']
-
-        # Mix of different risk levels
-        sanity = critical + high[:count//2] + medium[:count//4]
+        # Mix of different risk levels, bucketed in a single pass that stops
+        # as soon as every bucket is full
+        limits = {'critical': count, 'high': count // 2, 'medium': count // 4}
+        buckets = {'critical': [], 'high': [], 'medium': []}
+        remaining = sum(limits.values())
+        for p in priorities:
+            bucket = buckets.get(p.risk_level)
+            if bucket is None or len(bucket) >= limits[p.risk_level]:
+                continue
+            bucket.append(p)
+            remaining -= 1
+            if remaining == 0 or len(buckets['critical']) >= count:
+                break
+
+        sanity = buckets['critical'] + buckets['high'] + buckets['medium']
         return sanity[:count]
 
     def generate_priority_report(
@@ -260,9 +572,6 @@ class TestPrioritizer:
         output_file: str = "test_results/test_priority_report.json"
     ) -> str:
         """Generate test priority report."""
-        import json
-        from pathlib import Path
-
         report = {
             'timestamp': datetime.now().isoformat(),
             'total_tests': len(priorities),
@@ -290,17 +599,27 @@ class TestPrioritizer:
         }
 
         output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Repeated reports into the same directory skip the mkdir syscalls
+        if output_path.parent != self._ensured_dir:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dir = output_path.parent
 
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if HAS_ORJSON:
+            output_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2)
 
         logger.info(f"Generated priority report: {output_file}")
         return output_file
 
     def _group_by_risk(self, priorities: List[TestPriority]) -> Dict[str, int]:
         """Group tests by risk level."""
-        groups = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
-        for p in priorities:
-            groups[p.risk_level] += 1
-        return groups
+        if priorities is self._last_priorities and len(priorities) == len(self._last_risk_codes):
+            low, medium, high, critical = np.bincount(
+                self._last_risk_codes, minlength=len(RISK_LEVELS)
+            ).tolist()
+            return {'critical': critical, 'high': high, 'medium': medium, 'low': low}
+
+        counts = Counter(p.risk_level for p in priorities)
+        return {'critical': 0, 'high': 0, 'medium': 0, 'low': 0} | counts
@@ -1,9 +1,58 @@
 """
 Test if run_llm.py is using baseline knowledge to enrich answers
 """
-import subprocess
+import contextlib
+import io
 import json
 import re
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, wait
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+QUERY_TIMEOUT_S = 60
+
+# Phrases indicating the answer drew on baseline (non-database) knowledge
+BASELINE_PHRASES = (
+    'greenhouse', 'climate science', 'policy', 'mechanism', 'understand',
+    'means', 'significance', 'decarbonization', 'renewable', 'strategy'
+)
+ANSWER_RE = re.compile(r'=== ANSWER ===(.+?)(?:$|\n\n)', re.DOTALL)
+
+_capture = threading.local()
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """sys.stdout/sys.stderr stand-in routing each worker thread's writes to its own buffer"""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+
+    def write(self, s):
+        return (getattr(_capture, 'buffer', None) or self._fallback).write(s)
+
+    def flush(self):
+        self._fallback.flush()
+
+
+def run_question(question):
+    """Run run_llm.main() in-process and return everything it printed"""
+    buffer = io.StringIO()
+    _capture.buffer = buffer
+    try:
+        from src import run_llm
+        run_llm.main([question])
+    except SystemExit as e:
+        print(f"run_llm exited with status {e.code}", file=sys.stderr)
+    except Exception:
+        # Same as a crashed subprocess: the traceback becomes part of the output
+        traceback.print_exc()
+    finally:
+        _capture.buffer = None
+    return buffer.getvalue()
+
 
 test_cases = [
     {
@@ -40,31 +89,41 @@ results_summary = {
     "test_details": []
 }
 
-for i, test in enumerate(test_cases, 1):
+# Run the queries through run_llm.py in-process (imported once) and let the
+# independent LLM round-trips overlap, instead of one interpreter per question.
+# run_llm reads system_prompt.txt relative to the cwd at import, and the only
+# copy lives in src/, so run from there to test the production prompt.
+real_stdout, real_stderr = sys.stdout, sys.stderr
+sys.stdout, sys.stderr = _ThreadLocalStream(real_stdout), _ThreadLocalStream(real_stderr)
+sys.path.insert(0, str(REPO_ROOT))
+executor = ThreadPoolExecutor(max_workers=len(test_cases))
+try:
+    with contextlib.chdir(REPO_ROOT / "src"):
+        futures = [executor.submit(run_question, test['question']) for test in test_cases]
+        finished, _ = wait(futures, timeout=QUERY_TIMEOUT_S)
+        # Threads cannot be killed: questions still running past the limit are
+        # reported as timeouts, but joined (run_llm's own HTTP timeouts bound
+        # them) so their output stays in their buffers rather than leaking to
+        # the real streams, and the cwd is not restored under them
+        executor.shutdown(wait=True, cancel_futures=True)
+finally:
+    sys.stdout, sys.stderr = real_stdout, real_stderr
+
+for i, (test, future) in enumerate(zip(test_cases, futures), 1):
     print(f"\n[TEST {i}] {test['name']}")
     print(f"Question: {test['question']}")
     print(f"Expected - Baseline: {test['expect_baseline']}, MCP: {test['expect_mcp']}, Citations: {test['expect_citations']}")
     
     try:
-        # Run the query through run_llm.py
-        result = subprocess.run(
-            ['python', 'run_llm.py', test['question']],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd='/Users/dharmpratapsingh/Downloads/DataSets_ClimateGPT'
-        )
-        
-        output = result.stdout + result.stderr
+        if future not in finished:
+            raise TimeoutError
+        output = future.result()
         
         # Analyze output
         has_tool_call = '"tool"' in output and 'TOOL CALL' in output
         has_mcp_data = 'rows' in output and 'TOOL RESULT' in output
-        has_edgar_citation = 'EDGAR' in output or 'EDGAR v2024' in output
-        has_baseline_context = any(phrase in output for phrase in [
-            'greenhouse', 'climate science', 'policy', 'mechanism', 'understand',
-            'means', 'significance', 'decarbonization', 'renewable', 'strategy'
-        ])
+        has_edgar_citation = 'EDGAR' in output
+        has_baseline_context = any(phrase in output for phrase in BASELINE_PHRASES)
         
         # Check against expectations
         baseline_check = (has_baseline_context == test['expect_baseline'])
@@ -91,7 +150,7 @@ for i, test in enumerate(test_cases, 1):
                 results_summary["baseline_findings"].append(f"Test {i}: MCP data {'missing' if test['expect_mcp'] else 'present when not expected'}")
         
         # Extract answer snippet
-        answer_match = re.search(r'=== ANSWER ===(.+?)(?:$|\n\n)', output, re.DOTALL)
+        answer_match = ANSWER_RE.search(output)
         if answer_match:
             answer = answer_match.group(1).strip()[:200]
             results_summary["test_details"].append({
@@ -99,7 +158,7 @@ for i, test in enumerate(test_cases, 1):
                 "answer_snippet": answer
             })
         
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         print(f"✗ TEST TIMEOUT")
         results_summary["tests_failed"] += 1
         results_summary["baseline_findings"].append(f"Test {i}: Timeout executing query")
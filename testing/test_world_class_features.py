@@ -5,39 +5,107 @@ Comprehensive Test Suite for World-Class Testing Features
 Tests all 10 revolutionary features to ensure they work correctly.
 """
 
+import os
 import sys
+import gzip
 import json
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Feature modules are imported once here; a module that fails to import
+# only fails the tests that need it
+try:
+    from testing import ai_test_intelligence
+except ImportError:
+    ai_test_intelligence = None
+try:
+    from testing import chaos_engineering
+except ImportError:
+    chaos_engineering = None
+try:
+    from testing import advanced_observability
+except ImportError:
+    advanced_observability = None
+try:
+    from testing import self_healing_tests
+except ImportError:
+    self_healing_tests = None
+try:
+    from testing import intelligent_test_selection
+except ImportError:
+    intelligent_test_selection = None
+try:
+    from testing import multi_region_testing
+except ImportError:
+    multi_region_testing = None
+try:
+    from testing import test_data_platform as data_platform
+except ImportError:
+    data_platform = None
+try:
+    from testing import testing_economics
+except ImportError:
+    testing_economics = None
+try:
+    from testing import security_compliance_testing
+except ImportError:
+    security_compliance_testing = None
+try:
+    from testing import developer_experience
+except ImportError:
+    developer_experience = None
+
+
+def _require(module: object, module_name: str) -> None:
+    """Fail the calling test when its feature module could not be imported."""
+    if module is None:
+        raise ImportError(f"{module_name} could not be imported")
+
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-# Test results tracking
+# Test results tracking (kept in memory; written once by run_all_tests)
 test_results = {
     'passed': [],
     'failed': [],
     'total': 0
 }
+# Feature tests run concurrently, so updates to test_results are locked
+_results_lock = threading.Lock()
 
 
 def track_test_feature(feature_name: str):
     """Decorator to track test results."""
     def decorator(func):
         def wrapper():
-            test_results['total'] += 1
+            with _results_lock:
+                test_results['total'] += 1
             try:
                 logger.info(f"Testing: {feature_name}")
                 func()
-                test_results['passed'].append(feature_name)
+                with _results_lock:
+                    test_results['passed'].append(feature_name)
                 logger.info(f"✅ PASSED: {feature_name}\n")
                 return True
             except Exception as e:
-                test_results['failed'].append((feature_name, str(e)))
+                with _results_lock:
+                    test_results['failed'].append((feature_name, str(e)))
                 logger.error(f"❌ FAILED: {feature_name}")
                 logger.error(f"   Error: {e}\n")
                 return False
+        wrapper.feature_name = feature_name
         return wrapper
     return decorator
 
@@ -49,9 +117,9 @@ def track_test_feature(feature_name: str):
 @track_test_feature("1. AI/ML-Powered Intelligence")
 def test_ai_intelligence():
     """Test AI/ML test intelligence features."""
-    from testing.ai_test_intelligence import AITestIntelligence, TestPrediction
+    _require(ai_test_intelligence, 'testing.ai_test_intelligence')
 
-    ai = AITestIntelligence(model_type="openai")
+    ai = ai_test_intelligence.AITestIntelligence(model_type="openai")
 
     # Test failure prediction
     code_changes = ["src/query_engine.py", "src/database.py"]
@@ -100,19 +168,19 @@ def test_ai_intelligence():
 @track_test_feature("2. Chaos Engineering & Resilience")
 def test_chaos_engineering():
     """Test chaos engineering and fault injection."""
-    from testing.chaos_engineering import ChaosTestRunner, FaultType
+    _require(chaos_engineering, 'testing.chaos_engineering')
 
-    chaos = ChaosTestRunner()
+    chaos = chaos_engineering.ChaosTestRunner()
 
     # Create scenarios
     timeout_scenario = chaos.create_scenario(
         name="Timeout Scenario",
-        fault_type=FaultType.TIMEOUT,
+        fault_type=chaos_engineering.FaultType.TIMEOUT,
         severity="high"
     )
 
     assert timeout_scenario.name == "Timeout Scenario"
-    assert timeout_scenario.fault_type == FaultType.TIMEOUT
+    assert timeout_scenario.fault_type == chaos_engineering.FaultType.TIMEOUT
 
     # Test scenario execution
     def dummy_test():
@@ -144,10 +212,10 @@ def test_chaos_engineering():
 @track_test_feature("3. Advanced Observability & Telemetry")
 def test_observability():
     """Test distributed tracing and observability."""
-    from testing.advanced_observability import DistributedTracer, MetricsCollector, DashboardGenerator
+    _require(advanced_observability, 'testing.advanced_observability')
 
-    tracer = DistributedTracer()
-    metrics = MetricsCollector()
+    tracer = advanced_observability.DistributedTracer()
+    metrics = advanced_observability.MetricsCollector()
 
     # Test tracing
     trace = tracer.start_trace("test_operation")
@@ -173,7 +241,7 @@ def test_observability():
     assert len(metrics.metrics["response_time"]) > 0
 
     # Test dashboard generation
-    dashboard_gen = DashboardGenerator(tracer, metrics)
+    dashboard_gen = advanced_observability.DashboardGenerator(tracer, metrics)
     assert dashboard_gen is not None
 
     logger.info("  ✓ Distributed tracing works")
@@ -189,9 +257,9 @@ def test_observability():
 @track_test_feature("4. Self-Healing Tests")
 def test_self_healing():
     """Test self-healing test capabilities."""
-    from testing.self_healing_tests import SelfHealingTestRunner, AdaptiveWaiter
+    _require(self_healing_tests, 'testing.self_healing_tests')
 
-    runner = SelfHealingTestRunner()
+    runner = self_healing_tests.SelfHealingTestRunner()
 
     # Register test
     test = runner.register_test(1, "Test Query 1")
@@ -210,7 +278,7 @@ def test_self_healing():
     assert metrics.flakiness_score > 0
 
     # Test adaptive waiter
-    waiter = AdaptiveWaiter()
+    waiter = self_healing_tests.AdaptiveWaiter()
 
     def always_true():
         return True
@@ -232,9 +300,9 @@ def test_self_healing():
 @track_test_feature("5. Intelligent Test Selection")
 def test_intelligent_selection():
     """Test intelligent test selection."""
-    from testing.intelligent_test_selection import IntelligentSelector, CodeCoverageMapper
+    _require(intelligent_test_selection, 'testing.intelligent_test_selection')
 
-    selector = IntelligentSelector()
+    selector = intelligent_test_selection.IntelligentSelector()
 
     # Map test coverage
     selector.coverage_mapper.map_test_to_code(1, ["src/query.py", "src/database.py"])
@@ -268,9 +336,9 @@ def test_intelligent_selection():
 @track_test_feature("6. Multi-Region Testing")
 def test_multi_region():
     """Test multi-region testing capabilities."""
-    from testing.multi_region_testing import MultiRegionTester
+    _require(multi_region_testing, 'testing.multi_region_testing')
 
-    tester = MultiRegionTester()
+    tester = multi_region_testing.MultiRegionTester()
 
     # Test all regions
     def dummy_query():
@@ -301,9 +369,9 @@ def test_multi_region():
 @track_test_feature("7. Test Data Platform")
 def test_data_platform():
     """Test test data management platform."""
-    from testing.test_data_platform import TestDataPlatform
+    _require(data_platform, 'testing.test_data_platform')
 
-    platform = TestDataPlatform()
+    platform = data_platform.TestDataPlatform()
 
     # Generate realistic data
     schema = {
@@ -344,9 +412,9 @@ def test_data_platform():
 @track_test_feature("8. Testing Economics & ROI")
 def test_economics():
     """Test testing economics and ROI calculation."""
-    from testing.testing_economics import TestingEconomics
+    _require(testing_economics, 'testing.testing_economics')
 
-    econ = TestingEconomics()
+    econ = testing_economics.TestingEconomics()
 
     # Calculate cost per test
     cost = econ.calculate_cost_per_test("test_1", {"cpu_minutes": 2})
@@ -384,9 +452,9 @@ def test_economics():
 @track_test_feature("9. Security & Compliance Testing")
 def test_security():
     """Test security and compliance features."""
-    from testing.security_compliance_testing import SecurityComplianceTester
+    _require(security_compliance_testing, 'testing.security_compliance_testing')
 
-    security = SecurityComplianceTester()
+    security = security_compliance_testing.SecurityComplianceTester()
 
     # Scan OWASP
     findings = security.scan_for_owasp_top_10()
@@ -425,10 +493,10 @@ def test_security():
 @track_test_feature("10. Developer Experience Platform")
 def test_developer_experience():
     """Test developer experience platform."""
-    from testing.developer_experience import CLIInterface, NotificationManager, VSCodeExtension, TestCollaboration
+    _require(developer_experience, 'testing.developer_experience')
 
     # Test CLI
-    cli = CLIInterface()
+    cli = developer_experience.CLIInterface()
     assert 'run' in cli.commands
     assert 'watch' in cli.commands
 
@@ -436,16 +504,16 @@ def test_developer_experience():
     assert isinstance(success, bool)
 
     # Test notifications
-    notif_mgr = NotificationManager()
+    notif_mgr = developer_experience.NotificationManager()
     assert 'slack' in notif_mgr.channels
 
     # Test VS Code
-    vscode = VSCodeExtension()
+    vscode = developer_experience.VSCodeExtension()
     vscode.run_test_from_ide(1, "Test 1")
     assert vscode.active_test == "Test 1"
 
     # Test collaboration
-    collab = TestCollaboration()
+    collab = developer_experience.TestCollaboration()
     session = collab.create_session("session_1", ["test_1", "test_2"])
     assert session['session_id'] == "session_1"
     assert len(session['tests']) == 2
@@ -463,23 +531,72 @@ def test_developer_experience():
 # Run all tests
 # ============================================================================
 
+def _dump_json(obj) -> bytes:
+    """Serialize obj as indented UTF-8 JSON (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def write_sharded_report(report_dir: Path, timestamp: str) -> Path:
+    """
+    Write a small meta file plus one gzipped detail file per failure.
+
+    The meta file stays cheap to parse and diff in CI; failure details are
+    only read when investigating.
+    """
+    details_dir = report_dir / "details"
+    # Drop shards from earlier runs so details/ only holds this run's failures
+    for stale in details_dir.glob("*.json.gz"):
+        stale.unlink()
+    tests = [{'name': name, 'status': 'passed', 'detail_file': None} for name in test_results['passed']]
+
+    for name, error in test_results['failed']:
+        detail_file = details_dir / f"{hashlib.sha1(name.encode('utf-8')).hexdigest()[:16]}.json.gz"
+        details_dir.mkdir(parents=True, exist_ok=True)
+        detail = {'name': name, 'error': error, 'timestamp': timestamp}
+        detail_file.write_bytes(gzip.compress(_dump_json(detail), compresslevel=1))
+        tests.append({'name': name, 'status': 'failed', 'detail_file': str(detail_file.relative_to(report_dir))})
+
+    meta = {
+        'timestamp': timestamp,
+        'total': test_results['total'],
+        'passed_count': len(test_results['passed']),
+        'failed_count': len(test_results['failed']),
+        'tests': tests
+    }
+    meta_file = report_dir / "world_class_meta.json"
+    meta_file.write_bytes(_dump_json(meta))
+    return meta_file
+
+
 def run_all_tests():
     """Run all tests and generate report."""
     print("\n" + "=" * 80)
     print("WORLD-CLASS TESTING FEATURES - COMPREHENSIVE TEST SUITE")
     print("=" * 80 + "\n")
 
-    # Run all tests
-    test_ai_intelligence()
-    test_chaos_engineering()
-    test_observability()
-    test_self_healing()
-    test_intelligent_selection()
-    test_multi_region()
-    test_data_platform()
-    test_economics()
-    test_security()
-    test_developer_experience()
+    # Run all tests; the features are independent, so run them concurrently
+    tests = [
+        test_ai_intelligence,
+        test_chaos_engineering,
+        test_observability,
+        test_self_healing,
+        test_intelligent_selection,
+        test_multi_region,
+        test_data_platform,
+        test_economics,
+        test_security,
+        test_developer_experience,
+    ]
+    max_workers = min(len(tests), (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda test: test(), tests))
+
+    # Report in declaration order rather than completion order
+    order = {test.feature_name: i for i, test in enumerate(tests)}
+    test_results['passed'].sort(key=order.__getitem__)
+    test_results['failed'].sort(key=lambda failure: order[failure[0]])
 
     # Generate report
     print("\n" + "=" * 80)
@@ -502,8 +619,9 @@ def run_all_tests():
             print(f"     Error: {error}")
 
     # Save report
+    timestamp = datetime.now().isoformat()
     report = {
-        'timestamp': __import__('datetime').datetime.now().isoformat(),
+        'timestamp': timestamp,
         'total': test_results['total'],
         'passed': len(test_results['passed']),
         'failed': len(test_results['failed']),
@@ -514,10 +632,12 @@ def run_all_tests():
     report_file = Path("test_results/world_class_test_report.json")
     report_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    # Single write of the whole report once every test has run
+    report_file.write_bytes(_dump_json(report))
+    meta_file = write_sharded_report(report_file.parent, timestamp)
 
     print(f"\n📊 Report saved to: {report_file}")
+    print(f"   Summary: {meta_file}")
 
     # Final status
     print("\n" + "=" * 80)
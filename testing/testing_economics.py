@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +29,9 @@ class TestingEconomics:
 
     def __init__(self):
         """Initialize economics tracker."""
-        self.test_costs: Dict[str, float] = {}
+        # Per-test costs live in a growable float64 array indexed via _name_idx
+        self._cost_arr = np.empty(1024, dtype=np.float64)
+        self._name_idx: Dict[str, int] = {}
         self.bugs_caught = 0
         self.incidents_prevented = 0
         self.deployment_cost_per_failure_usd = 1000  # Avg cost of prod failure
@@ -37,12 +41,26 @@ class TestingEconomics:
         # Simple model: $0.0001 per compute minute
         compute_minutes = sum(cloud_resources_used.values())
         cost = compute_minutes * 0.0001
-        self.test_costs[test_name] = cost
+
+        idx = self._name_idx.get(test_name)
+        if idx is None:
+            idx = len(self._name_idx)
+            if idx == len(self._cost_arr):
+                self._cost_arr = np.concatenate([self._cost_arr, np.empty_like(self._cost_arr)])
+            self._name_idx[test_name] = idx
+        self._cost_arr[idx] = cost
         return cost
 
+    @property
+    def test_costs(self) -> Dict[str, float]:
+        """Per-test costs keyed by test name."""
+        costs = self._cost_arr[:len(self._name_idx)].tolist()
+        return dict(zip(self._name_idx, costs))
+
     def calculate_roi(self, test_automation_cost_usd: float, time_period_months: int = 12) -> EconomicsMetrics:
         """Calculate ROI of test automation."""
-        total_test_cost = sum(self.test_costs.values())
+        test_count = len(self._name_idx)
+        total_test_cost = float(self._cost_arr[:test_count].sum())
 
         # Value calculation
         bugs_value = self.bugs_caught * 500  # Avg cost of bug fix
@@ -56,7 +74,7 @@ class TestingEconomics:
 
         return EconomicsMetrics(
             total_cost_usd=total_test_cost,
-            cost_per_test_usd=total_test_cost / max(len(self.test_costs), 1),
+            cost_per_test_usd=total_test_cost / max(test_count, 1),
             bugs_caught=self.bugs_caught,
             production_incidents_prevented=self.incidents_prevented,
             roi_percent=round(roi_percent, 1),
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the cached aggregates in the test maintenance tracker
+"""
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# Add project root to path to import the testing package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from testing import test_maintenance as maintenance
+
+
+def _frozen_now(moment: datetime):
+    """Patch the tracker module's clock to ``moment``."""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return moment
+
+    return mock.patch.object(maintenance, 'datetime', FrozenDatetime)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return maintenance.TestMaintenanceTracker(str(tmp_path / "test_metadata.json"))
+
+
+def test_update_test_refreshes_cached_metrics(tracker):
+    tracker.register_test(maintenance.TestMetadata(1, "test_a", owner="alice"))
+    assert tracker.get_maintenance_metrics()['by_status'] == {'active': 1}
+
+    tracker.update_test(1, status='deprecated')
+
+    metrics = tracker.get_maintenance_metrics()
+    assert metrics['by_status'] == {'deprecated': 1}
+    assert metrics['maintenance_health'] == 97.0
+
+
+def test_cached_metrics_expire_when_a_test_changes_age_bucket(tracker):
+    tracker.register_test(maintenance.TestMetadata(1, "test_a", owner="alice"))
+    assert tracker.get_maintenance_metrics()['by_age']['0-30_days'] == 1
+
+    with _frozen_now(datetime.now() + timedelta(days=31)):
+        assert tracker.get_maintenance_metrics()['by_age']['30-90_days'] == 1
+
+
+def test_update_test_rejects_unknown_fields(tracker):
+    tracker.register_test(maintenance.TestMetadata(1, "test_a"))
+
+    with pytest.raises(ValueError):
+        tracker.update_test(1, test_id=2)
+    with pytest.raises(ValueError):
+        tracker.update_test(1, not_a_field=True)
+
+
+def test_run_test_becomes_obsolete_after_91_days(tracker):
+    tracker.register_test(maintenance.TestMetadata(1, "test_a", owner="alice"))
+    tracker.update_test_run(1)
+    assert tracker.detect_obsolete_tests() == []
+
+    with _frozen_now(datetime.now() + timedelta(days=120)):
+        assert [t.test_id for t in tracker.detect_obsolete_tests()] == [1]
+
+
+def test_health_score_counts_deprecated_tests(tracker):
+    tracker.register_test(maintenance.TestMetadata(1, "test_a", owner="alice"))
+    tracker.register_test(maintenance.TestMetadata(2, "test_b", owner="bob"))
+    tracker.mark_test_deprecated(2, "superseded")
+
+    metrics = tracker.get_maintenance_metrics()
+    assert metrics['by_status'] == {'active': 1, 'deprecated': 1}
+    assert metrics['maintenance_health'] == 97.0
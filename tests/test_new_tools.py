@@ -4,10 +4,15 @@ Test script for new ClimateGPT MCP tools
 
 Tests the Phase 3 tools: top_emitters, analyze_trend, compare_sectors, compare_geographies
 """
+import atexit
+import functools
 import json
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path to import mcp_server_stdio functions
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -22,6 +27,24 @@ except ImportError as e:
     print("Make sure mcp_server_stdio.py is in the same directory")
     sys.exit(1)
 
+WAREHOUSE_DB = "data/warehouse/climategpt.duckdb"
+
+@functools.lru_cache(maxsize=1)
+def _warehouse_connection():
+    """Attach the warehouse (read-only) to one in-memory connection shared across tests."""
+    import duckdb
+    conn = duckdb.connect(":memory:", config={'threads': os.cpu_count() or 1})
+    conn.execute(f"ATTACH '{WAREHOUSE_DB}' AS warehouse (READ_ONLY)")
+    conn.execute("USE warehouse")
+    # Close only a connection that was actually opened
+    atexit.register(conn.close)
+    return conn
+
+@pytest.fixture(scope="session")
+def warehouse_conn():
+    """Session-wide warehouse connection for pytest runs."""
+    return _warehouse_connection()
+
 def test_entity_resolution():
     """Test Phase 2: Entity Resolution"""
     print("=" * 80)
@@ -72,8 +95,10 @@ def test_cache():
     print("=" * 80)
     print()
     
-    # Clear cache for clean test
+    # Clear caches for clean test
     query_cache.clear()
+    _normalize_entity_name.cache_clear()
+    _get_iso3_code.cache_clear()
     
     print("Cache initialized:")
     stats = query_cache.get_stats()
@@ -88,7 +113,7 @@ def test_cache():
     
     return True
 
-def test_materialized_views():
+def test_materialized_views(warehouse_conn):
     """Test Phase 4: Materialized Views"""
     print("=" * 80)
     print("TESTING PHASE 4: MATERIALIZED VIEWS")
@@ -96,8 +121,8 @@ def test_materialized_views():
     print()
     
     try:
-        import duckdb
-        conn = duckdb.connect("data/warehouse/climategpt.duckdb", read_only=True)
+        # Reopen here when the caller could not, so the error is reported below
+        conn = warehouse_conn if warehouse_conn is not None else _warehouse_connection()
         
         # Check if views exist
         views = conn.execute("""
@@ -110,9 +135,14 @@ def test_materialized_views():
         
         if views:
             print(f"✅ Found {len(views)} materialized views:")
-            for (view_name,) in views:
-                count = conn.execute(f"SELECT COUNT(*) FROM {view_name}").fetchone()[0]
-                print(f"  - {view_name}: {count:,} rows")
+            # One round-trip for every view's row count
+            counts_sql = " UNION ALL ".join(
+                f"SELECT {i} AS pos, COUNT(*) AS row_count FROM \"{view_name}\""
+                for i, (view_name,) in enumerate(views)
+            )
+            counts = dict(conn.execute(counts_sql).fetchall())
+            for i, (view_name,) in enumerate(views):
+                print(f"  - {view_name}: {counts[i]:,} rows")
             
             # Test a query
             print()
@@ -134,10 +164,8 @@ def test_materialized_views():
         else:
             print("❌ No materialized views found")
             print("   Run: python create_materialized_views.py")
-            conn.close()
             return False
         
-        conn.close()
         print()
         return True
         
@@ -158,10 +186,16 @@ def main():
     print("=" * 80)
     print()
     
+    # Open the warehouse once up front and hand it to the tests that query it
+    try:
+        warehouse_conn = _warehouse_connection()
+    except Exception:
+        warehouse_conn = None  # test_materialized_views reports the failure
+
     results = {
         "Phase 2: Entity Resolution": test_entity_resolution(),
         "Phase 4: Query Cache": test_cache(),
-        "Phase 4: Materialized Views": test_materialized_views(),
+        "Phase 4: Materialized Views": test_materialized_views(warehouse_conn),
     }
     
     print("=" * 80)
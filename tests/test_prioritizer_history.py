@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Regression tests for incremental history ingestion in the test prioritizer
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path to import the testing package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from testing import test_prioritization as prioritization
+
+
+def test_rows_sharing_the_watermark_timestamp_are_not_dropped(tmp_path):
+    state_file = str(tmp_path / "prioritizer_state.pkl")
+    first_batch = [
+        {'question_id': 1, 'timestamp': '2025-01-01T00:00:00', 'error': None},
+        {'question_id': 2, 'timestamp': '2025-01-01T00:00:00', 'error': 'timeout'},
+    ]
+    prioritizer = prioritization.TestPrioritizer(state_file=state_file)
+    prioritizer._ingest_new_history(first_batch)
+
+    # A parallel result with the same second-resolution timestamp arrives later
+    late = {'question_id': 3, 'timestamp': '2025-01-01T00:00:00', 'error': None}
+    restored = prioritization.TestPrioritizer(state_file=state_file)
+    restored._ingest_new_history(first_batch + [late])
+
+    assert sorted(restored.test_history) == [1, 2, 3]
+    assert restored.history_cache_hits == 2
+    assert restored.history_cache_misses == 1
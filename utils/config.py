@@ -1,67 +1,132 @@
 """
 Centralized configuration management for ClimateGPT.
 All environment variables and configurable parameters in one place.
+
+Prefer the typed ``config`` instance (``config.db_pool_size``); the
+``Config`` class mirrors it with the legacy upper-case attribute names.
 """
 import os
 import logging
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
 
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Typed, immutable settings parsed once from environment variables"""
+
+    environment: str = "production"
+    db_path: str = "data/warehouse/climategpt.duckdb"
+    db_pool_size: int = 10
+    db_max_connections: int = 20
+    llm_concurrency_limit: int = 10
+    openai_api_key: str = field(default="", repr=False)
+    model: str = "/cache/climategpt_8b_test"
+    rate_limit_max_requests: int = 100
+    rate_limit_window_seconds: int = 60
+    allowed_origins: tuple[str, ...] = ()
+    cache_size: int = 1000
+    cache_ttl_seconds: int = 300
+    http_host: str = "0.0.0.0"
+    http_port: int = 8010
+
+    @property
+    def is_production(self) -> bool:
+        return self.environment == "production"
+
+    @property
+    def is_development(self) -> bool:
+        return self.environment == "development"
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Read and convert every setting from the environment in one pass"""
+        environment = os.getenv("ENVIRONMENT", "production")
+
+        allowed_origins_env = os.getenv("ALLOWED_ORIGINS")
+        if not allowed_origins_env:
+            if environment == "development":
+                allowed_origins = ("http://localhost:8501", "http://localhost:3000")
+            else:
+                # Production requires explicit CORS configuration
+                allowed_origins = ()
+        else:
+            allowed_origins = tuple(origin.strip() for origin in allowed_origins_env.split(","))
+
+        return cls(
+            environment=environment,
+            db_path=os.getenv("DB_PATH", "data/warehouse/climategpt.duckdb"),
+            db_pool_size=_env_int("DB_POOL_SIZE", 10),
+            db_max_connections=_env_int("DB_MAX_CONNECTIONS", 20),
+            llm_concurrency_limit=_env_int("LLM_CONCURRENCY_LIMIT", 10),
+            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+            model=os.getenv("MODEL", "/cache/climategpt_8b_test"),
+            rate_limit_max_requests=_env_int("RATE_LIMIT_MAX_REQUESTS", 100),
+            rate_limit_window_seconds=_env_int("RATE_LIMIT_WINDOW_SECONDS", 60),
+            allowed_origins=allowed_origins,
+            cache_size=_env_int("CACHE_SIZE", 1000),
+            cache_ttl_seconds=_env_int("CACHE_TTL_SECONDS", 300),
+            http_host=os.getenv("HTTP_HOST", "0.0.0.0"),
+            http_port=_env_int("HTTP_PORT", 8010),
+        )
+
+
+config = Settings.from_env()
+
+
 class Config:
     """Application configuration loaded from environment variables"""
 
     # ========================================================================
     # ENVIRONMENT
     # ========================================================================
-    ENVIRONMENT = os.getenv("ENVIRONMENT", "production")
-    IS_PRODUCTION = ENVIRONMENT == "production"
-    IS_DEVELOPMENT = ENVIRONMENT == "development"
+    ENVIRONMENT = config.environment
+    IS_PRODUCTION = config.is_production
+    IS_DEVELOPMENT = config.is_development
 
     # ========================================================================
     # DATABASE CONFIGURATION
     # ========================================================================
-    DB_PATH = os.getenv("DB_PATH", "data/warehouse/climategpt.duckdb")
-    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
-    DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "20"))
+    DB_PATH = config.db_path
+    DB_POOL_SIZE = config.db_pool_size
+    DB_MAX_CONNECTIONS = config.db_max_connections
 
     # ========================================================================
     # LLM CONFIGURATION
     # ========================================================================
-    LLM_CONCURRENCY_LIMIT = int(os.getenv("LLM_CONCURRENCY_LIMIT", "10"))
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-    MODEL = os.getenv("MODEL", "/cache/climategpt_8b_test")
+    LLM_CONCURRENCY_LIMIT = config.llm_concurrency_limit
+    OPENAI_API_KEY = config.openai_api_key
+    # Parsed once from OPENAI_API_KEY by validate()/get_user_pass()
+    _USER_PASS: tuple[str, str] | None = None
+    MODEL = config.model
 
     # ========================================================================
     # RATE LIMITING
     # ========================================================================
-    RATE_LIMIT_MAX_REQUESTS = int(os.getenv("RATE_LIMIT_MAX_REQUESTS", "100"))
-    RATE_LIMIT_WINDOW_SECONDS = int(os.getenv("RATE_LIMIT_WINDOW_SECONDS", "60"))
+    RATE_LIMIT_MAX_REQUESTS = config.rate_limit_max_requests
+    RATE_LIMIT_WINDOW_SECONDS = config.rate_limit_window_seconds
 
     # ========================================================================
     # CORS CONFIGURATION
     # ========================================================================
-    ALLOWED_ORIGINS_ENV = os.getenv("ALLOWED_ORIGINS")
-    if not ALLOWED_ORIGINS_ENV:
-        if IS_DEVELOPMENT:
-            ALLOWED_ORIGINS = ["http://localhost:8501", "http://localhost:3000"]
-        else:
-            # Production requires explicit CORS configuration
-            ALLOWED_ORIGINS = []
-    else:
-        ALLOWED_ORIGINS = [origin.strip() for origin in ALLOWED_ORIGINS_ENV.split(",")]
+    ALLOWED_ORIGINS = config.allowed_origins
 
     # ========================================================================
     # CACHE CONFIGURATION
     # ========================================================================
-    CACHE_SIZE = int(os.getenv("CACHE_SIZE", "1000"))
-    CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+    CACHE_SIZE = config.cache_size
+    CACHE_TTL_SECONDS = config.cache_ttl_seconds
 
     # ========================================================================
     # SERVER CONFIGURATION
     # ========================================================================
-    HTTP_HOST = os.getenv("HTTP_HOST", "0.0.0.0")
-    HTTP_PORT = int(os.getenv("HTTP_PORT", "8010"))
+    HTTP_HOST = config.http_host
+    HTTP_PORT = config.http_port
 
     # ========================================================================
     # VALIDATION
@@ -87,6 +152,8 @@ class Config:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         if ":" not in cls.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY must be in format 'username:password'")
+        user, password = cls.OPENAI_API_KEY.split(":", 1)
+        cls._USER_PASS = (user, password)
 
         # Validate CORS in production
         if cls.IS_PRODUCTION and not cls.ALLOWED_ORIGINS:
@@ -95,20 +162,36 @@ class Config:
                 "Set it to a comma-separated list of allowed origins."
             )
 
-        # Log configuration
-        logger.info(f"Environment: {cls.ENVIRONMENT}")
-        logger.info(f"Database pool size: {cls.DB_POOL_SIZE}")
-        logger.info(f"LLM concurrency limit: {cls.LLM_CONCURRENCY_LIMIT}")
-        logger.info(f"Rate limiting: {cls.RATE_LIMIT_MAX_REQUESTS} requests per {cls.RATE_LIMIT_WINDOW_SECONDS}s")
-        logger.info(f"Cache: {cls.CACHE_SIZE} entries, TTL {cls.CACHE_TTL_SECONDS}s")
-        logger.info(f"CORS origins: {cls.ALLOWED_ORIGINS}")
+        # Log configuration as a single record
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Configuration loaded: environment={cls.ENVIRONMENT}, "
+                f"db_pool_size={cls.DB_POOL_SIZE}, "
+                f"llm_concurrency_limit={cls.LLM_CONCURRENCY_LIMIT}, "
+                f"rate_limit={cls.RATE_LIMIT_MAX_REQUESTS}/{cls.RATE_LIMIT_WINDOW_SECONDS}s, "
+                f"cache={cls.CACHE_SIZE} entries/{cls.CACHE_TTL_SECONDS}s TTL, "
+                f"cors_origins={list(cls.ALLOWED_ORIGINS)}",
+                extra={"config": {
+                    "environment": cls.ENVIRONMENT,
+                    "db_pool_size": cls.DB_POOL_SIZE,
+                    "llm_concurrency_limit": cls.LLM_CONCURRENCY_LIMIT,
+                    "rate_limit_max_requests": cls.RATE_LIMIT_MAX_REQUESTS,
+                    "rate_limit_window_seconds": cls.RATE_LIMIT_WINDOW_SECONDS,
+                    "cache_size": cls.CACHE_SIZE,
+                    "cache_ttl_seconds": cls.CACHE_TTL_SECONDS,
+                    "allowed_origins": cls.ALLOWED_ORIGINS,
+                }},
+            )
 
     @classmethod
     def get_user_pass(cls) -> tuple[str, str]:
         """Extract username and password from API key"""
+        if cls._USER_PASS is not None:
+            return cls._USER_PASS
         if ":" in cls.OPENAI_API_KEY:
-            parts = cls.OPENAI_API_KEY.split(":", 1)
-            return parts[0], parts[1]
+            user, password = cls.OPENAI_API_KEY.split(":", 1)
+            cls._USER_PASS = (user, password)
+            return cls._USER_PASS
         raise ValueError("OPENAI_API_KEY must contain ':' separator")
 
 
@@ -29,7 +29,7 @@ def sanitize_error_message(error: Exception, context: str = "") -> str:
     from middleware.request_tracking import get_request_id
 
     # Log full error details server-side
-    logger.error(f"Error in {context}: {type(error).__name__}: {str(error)}", exc_info=True)
+    logger.error("Error in %s: %s: %s", context, type(error).__name__, error, exc_info=True)
 
     if IS_PRODUCTION:
         # Production: Return generic message with request ID for tracing
@@ -55,15 +55,16 @@ def sanitize_sql_error(error: Exception, sql: str = "", params: list[Any] | None
     Returns:
         Safe error message
     """
-    # Log SQL query server-side only (truncate long queries)
+    # Log SQL query server-side only (truncate long queries); arguments are
+    # formatted lazily by logging, only if the record is emitted
     if sql:
         truncated_sql = sql[:200] + "..." if len(sql) > 200 else sql
-        logger.error(f"SQL query failed: {truncated_sql}")
+        logger.error("SQL query failed: %s", truncated_sql)
 
     if params:
-        logger.error(f"SQL params: {params}")
+        logger.error("SQL params: %s", params)
 
-    logger.error(f"SQL error: {str(error)}", exc_info=True)
+    logger.error("SQL error: %s", error, exc_info=True)
 
     if IS_PRODUCTION:
         return "Database query failed. Please check your input parameters."
@@ -98,7 +99,7 @@ def sanitize_validation_error(error: Exception) -> dict[str, Any]:
                 ]
             }
     except Exception as e:
-        logger.error(f"Error sanitizing validation error: {e}")
+        logger.error("Error sanitizing validation error: %s", e)
 
     # Fallback
     return {
@@ -1,57 +1,201 @@
 """
 Optimized serialization utilities for large datasets.
+
+Parameters and locals are fully annotated so the module can be compiled
+ahead of time with mypyc (``mypyc utils/serialization.py``) where that
+pays off; it runs unchanged as plain Python.
 """
+import io
 import json
 import gzip
-from typing import Any, Iterator
+import threading
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any, Iterable, Iterator
 import logging
+import statistics
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    # Reused encoder; msgspec is the fallback when orjson is unavailable
+    _MSGSPEC_ENCODER = msgspec.json.Encoder()
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 logger = logging.getLogger(__name__)
 
-# Threshold for using streaming serialization (number of rows)
-STREAMING_THRESHOLD = 1000
+# Threshold for considering streaming serialization (number of rows)
+STREAMING_THRESHOLD = 100_000
+
+# Payloads estimated below this are encoded in a single dumps call, which is
+# an order of magnitude faster than encoding row by row
+SINGLE_DUMP_MAX_BYTES = 64 * 1024 * 1024
+
+# gzip level for API payloads; higher levels cost far more CPU than they save on the wire
+GZIP_COMPRESSLEVEL = 1
+
+# zstd level for API payloads when the client accepts zstd
+ZSTD_LEVEL = 3
+
+# Rows sampled by estimate_response_size
+ESTIMATE_SAMPLE_SIZE = 64
+
+# ZstdCompressor instances are not thread-safe, so each thread reuses its own
+_zstd_local = threading.local()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson, then msgspec, then json)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    if HAS_MSGSPEC:
+        return _MSGSPEC_ENCODER.encode(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _fits_single_dump(items: list[dict[str, Any]]) -> bool:
+    """Whether the whole array is small enough to encode in one call."""
+    return len(items) < STREAMING_THRESHOLD or estimate_response_size(items) < SINGLE_DUMP_MAX_BYTES
+
+
+def _zstd_compressor() -> "zstandard.ZstdCompressor":
+    """This thread's reusable multi-threaded zstd compressor."""
+    cctx = getattr(_zstd_local, 'cctx', None)
+    if cctx is None:
+        cctx = _zstd_local.cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+    return cctx
 
 
 def serialize_large_response(
     data: list[dict[str, Any]],
-    compress: bool = False
+    compress: bool = False,
+    encoding: str = 'gzip'
 ) -> str | bytes:
     """
     Efficiently serialize large responses.
 
-    For datasets >1000 rows, uses streaming JSON serialization.
-    Optionally compresses result with gzip.
+    Encodes the whole list in one call unless it is estimated above
+    SINGLE_DUMP_MAX_BYTES, in which case rows are serialized one at a time.
+    Optionally compresses result with gzip, or zstd when requested (several
+    times faster at a similar ratio); large payloads are written straight
+    into the compressor so the uncompressed JSON is never held in memory.
 
     Args:
         data: List of data dictionaries
-        compress: Whether to gzip compress the result
+        compress: Whether to compress the result
+        encoding: Compression format, 'gzip' or 'zstd' (requires zstandard)
 
     Returns:
         JSON string or compressed bytes
     """
-    if len(data) < STREAMING_THRESHOLD:
-        # Small dataset: use standard json.dumps
-        json_str = json.dumps(data, separators=(',', ':'))  # Compact format
+    if compress:
+        if encoding == 'zstd':
+            if not HAS_ZSTD:
+                raise ValueError("zstd encoding requires the zstandard package")
+            return _compress_json_array_zstd(data)
+        if encoding != 'gzip':
+            raise ValueError(f"Unsupported encoding: {encoding}")
+        return _compress_json_array(data)
+
+    return _stream_json_bytes(data).decode('utf-8')
+
+
+def _compress_json_array(data: list[dict[str, Any]]) -> bytes:
+    """Gzip a JSON array; very large arrays are fed to the compressor row by row."""
+    if _fits_single_dump(data):
+        json_bytes = _dumps(data)
+        raw_size: int = len(json_bytes)
+        compressed = gzip.compress(json_bytes, compresslevel=GZIP_COMPRESSLEVEL)
+    else:
+        logger.info(f"Using streaming compression for {len(data)} rows")
+        buf = io.BytesIO()
+        raw_size = 0
+        with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=GZIP_COMPRESSLEVEL) as gz:
+            for chunk in iter_json_array(data):
+                gz.write(chunk)
+                raw_size += len(chunk)
+        compressed = buf.getvalue()
+
+    # Compress with gzip (typically 70-90% size reduction)
+    compression_ratio: float = len(compressed) / raw_size * 100
+    logger.info(f"Compressed {raw_size} bytes to {len(compressed)} bytes ({compression_ratio:.1f}%)")
+    return compressed
+
+
+def _compress_json_array_zstd(data: list[dict[str, Any]]) -> bytes:
+    """Zstd-compress a JSON array; very large arrays are fed to the compressor row by row."""
+    cctx = _zstd_compressor()
+    if _fits_single_dump(data):
+        json_bytes = _dumps(data)
+        raw_size: int = len(json_bytes)
+        compressed: bytes = cctx.compress(json_bytes)
     else:
-        # Large dataset: use streaming
-        logger.info(f"Using streaming serialization for {len(data)} rows")
-        json_str = stream_json_array(data)
+        logger.info(f"Using streaming zstd compression for {len(data)} rows")
+        compressor = cctx.compressobj()
+        parts: list[bytes] = []
+        raw_size = 0
+        for chunk in iter_json_array(data):
+            parts.append(compressor.compress(chunk))
+            raw_size += len(chunk)
+        parts.append(compressor.flush())
+        compressed = b''.join(parts)
+
+    compression_ratio: float = len(compressed) / raw_size * 100
+    logger.info(f"Compressed {raw_size} bytes to {len(compressed)} bytes with zstd ({compression_ratio:.1f}%)")
+    return compressed
+
+
+def iter_json_array(items: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Serialize a JSON array incrementally, one row at a time.
 
-    if compress:
-        # Compress with gzip (typically 70-90% size reduction)
-        compressed = gzip.compress(json_str.encode('utf-8'))
-        compression_ratio = len(compressed) / len(json_str) * 100
-        logger.info(f"Compressed {len(json_str)} bytes to {len(compressed)} bytes ({compression_ratio:.1f}%)")
-        return compressed
+    Memory stays constant regardless of row count, so the chunks can be
+    fed to a gzip writer or a chunked HTTP response (e.g. Starlette's
+    StreamingResponse) as they are produced.
 
-    return json_str
+    Args:
+        items: Items to serialize (any iterable, including generators)
+
+    Yields:
+        UTF-8 JSON byte chunks
+    """
+    yield b'['
+    first: bool = True
+    for item in items:
+        if first:
+            first = False
+        else:
+            yield b','
+        yield _dumps(item)
+    yield b']'
 
 
 def stream_json_array(items: list[dict[str, Any]]) -> str:
     """
-    Stream-serialize JSON array without loading all in memory.
+    Serialize a JSON array into a single string.
 
-    More memory-efficient for large arrays.
+    Encodes the whole list in one call when it fits under
+    SINGLE_DUMP_MAX_BYTES. Prefer iter_json_array when the caller can
+    consume chunks directly.
 
     Args:
         items: List of items to serialize
@@ -59,24 +203,28 @@ def stream_json_array(items: list[dict[str, Any]]) -> str:
     Returns:
         JSON string
     """
-    parts = ['[']
+    return _stream_json_bytes(items).decode('utf-8')
 
-    for i, item in enumerate(items):
-        if i > 0:
-            parts.append(',')
-        parts.append(json.dumps(item, separators=(',', ':')))
 
-    parts.append(']')
-    return ''.join(parts)
+def _stream_json_bytes(items: list[dict[str, Any]]) -> bytes:
+    """Serialize items into a single JSON array of bytes."""
+    if _fits_single_dump(items):
+        return _dumps(items)
+    logger.info(f"Using streaming serialization for {len(items)} rows")
+    return b''.join(iter_json_array(items))
 
 
 def chunk_large_response(
-    data: list[dict[str, Any]],
+    data: Iterable[dict[str, Any]],
     chunk_size: int = 1000
 ) -> Iterator[list[dict[str, Any]]]:
     """
     Split large response into chunks for pagination.
 
+    Lists are sliced directly; any other iterable (e.g. a generator over
+    a DuckDB cursor) is consumed once through islice, so the full
+    dataset never has to be materialized.
+
     Args:
         data: Full dataset
         chunk_size: Rows per chunk
@@ -84,28 +232,41 @@ def chunk_large_response(
     Yields:
         Chunks of data
     """
-    for i in range(0, len(data), chunk_size):
-        yield data[i:i + chunk_size]
+    if isinstance(data, Sequence):
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+        return
+
+    rows = iter(data)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
 
 
 def create_paginated_response(
-    data: list[dict[str, Any]],
+    data: "pa.Table | Iterable[dict[str, Any]]",
     page: int = 1,
-    page_size: int = 1000
+    page_size: int = 1000,
+    total_rows: int | None = None
 ) -> dict[str, Any]:
     """
     Create paginated response from large dataset.
 
     Args:
-        data: Full dataset
+        data: Full dataset (list of rows or Arrow table), or an iterable
+            of rows when total_rows is given. Arrow tables are sliced
+            zero-copy and only the returned page is converted to rows.
         page: Page number (1-indexed)
         page_size: Rows per page
+        total_rows: Known row count (e.g. from a DuckDB COUNT(*)); lets
+            data be a one-shot iterable instead of a list
 
     Returns:
         Paginated response with metadata
     """
-    total_rows = len(data)
-    total_pages = (total_rows + page_size - 1) // page_size  # Ceiling division
+    is_arrow = HAS_PYARROW and isinstance(data, pa.Table)
+    if total_rows is None:
+        total_rows = data.num_rows if is_arrow else len(data)
+    total_pages: int = (total_rows + page_size - 1) // page_size  # Ceiling division
 
     # Validate page number
     if page < 1:
@@ -114,11 +275,17 @@ def create_paginated_response(
         page = total_pages
 
     # Calculate slice indices
-    start_idx = (page - 1) * page_size
-    end_idx = min(start_idx + page_size, total_rows)
+    start_idx: int = (page - 1) * page_size
+    end_idx: int = min(start_idx + page_size, total_rows)
 
     # Extract page data
-    page_data = data[start_idx:end_idx]
+    page_data: Sequence[dict[str, Any]]
+    if is_arrow:
+        page_data = data.slice(start_idx, end_idx - start_idx).to_pylist()
+    elif isinstance(data, Sequence):
+        page_data = data[start_idx:end_idx]
+    else:
+        page_data = list(islice(data, start_idx, end_idx))
 
     return {
         "data": page_data,
@@ -137,7 +304,8 @@ def estimate_response_size(data: list[dict[str, Any]]) -> int:
     """
     Estimate size of response in bytes (without actually serializing).
 
-    Uses sampling for large datasets.
+    Uses the median serialized row size over a sample of the first
+    ESTIMATE_SAMPLE_SIZE rows.
 
     Args:
         data: Dataset to estimate
@@ -148,33 +316,34 @@ def estimate_response_size(data: list[dict[str, Any]]) -> int:
     if not data:
         return 0
 
-    # Sample first few rows to estimate average row size
-    sample_size = min(10, len(data))
-    sample = data[:sample_size]
-
-    # Serialize sample
-    sample_json = json.dumps(sample, separators=(',', ':'))
-    sample_bytes = len(sample_json.encode('utf-8'))
+    # Median row size over a sample resists skew from a single giant row
+    sample = data[:ESTIMATE_SAMPLE_SIZE]
+    median_row_size: float = statistics.median(len(_dumps(row)) for row in sample)
 
-    # Estimate total size
-    avg_row_size = sample_bytes / sample_size
-    estimated_total = int(avg_row_size * len(data))
+    # Estimate total size (rows plus separators and brackets)
+    estimated_total: int = int((median_row_size + 1) * len(data)) + 1
 
     return estimated_total
 
 
-def should_compress_response(data: list[dict[str, Any]], threshold_mb: float = 1.0) -> bool:
+def should_compress_response(
+    data: list[dict[str, Any]],
+    threshold_mb: float = 1.0,
+    estimate: int | None = None
+) -> bool:
     """
     Determine if response should be compressed based on size.
 
     Args:
         data: Dataset
         threshold_mb: Size threshold in megabytes
+        estimate: Size from estimate_response_size(data) when the caller
+            already has one for this request; computed here otherwise
 
     Returns:
         True if response should be compressed
     """
-    estimated_size = estimate_response_size(data)
-    threshold_bytes = threshold_mb * 1024 * 1024
+    estimated_size: int = estimate if estimate is not None else estimate_response_size(data)
+    threshold_bytes: float = threshold_mb * 1024 * 1024
 
     return estimated_size > threshold_bytes